@@ -0,0 +1,65 @@
+import hashlib
+import timeit
+import uuid
+from dataclasses import fields
+from datetime import datetime, timedelta
+
+from core.commands.broker import UpdateSettings
+from core.commands.feed import StartRealtimeFeed
+from core.events.base import EventMeta
+from core.events.ohlcv import NewMarketDataReceived
+from core.models.broker import MarginMode, PositionMode
+from core.models.ohlcv import OHLCV
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+
+NUMBER = 100_000
+
+SYMBOL = Symbol("BTCUSDT", 0.0006, 0.0001, 0.001, 0.01, 3, 2)
+OHLCV_ROW = OHLCV(1700000000000, 1.0, 2.0, 0.5, 1.5, 10.0)
+
+
+def legacy_meta():
+    return EventMeta(key=str(uuid.uuid4()), timestamp=datetime.now().timestamp())
+
+
+def legacy_command_key(command):
+    attribute_values = [
+        getattr(command, field.name)
+        for field in fields(command)
+        if field.name not in ["meta", "_execution_event"]
+    ]
+    expiration = datetime.now() + timedelta(seconds=5)
+    concatenated = f"{command.__class__.__name__}{attribute_values}{expiration}"
+
+    return hashlib.sha256(concatenated.encode("utf-8")).hexdigest()
+
+
+def main():
+    settings = UpdateSettings(SYMBOL, 1, PositionMode.ONE_WAY, MarginMode.ISOLATED)
+    feed = StartRealtimeFeed(SYMBOL, Timeframe.ONE_MINUTE)
+
+    cases = {
+        "EventMeta": EventMeta,
+        "legacy EventMeta": legacy_meta,
+        "NewMarketDataReceived": lambda: NewMarketDataReceived(
+            SYMBOL, Timeframe.ONE_MINUTE, OHLCV_ROW, True
+        ),
+        "StartRealtimeFeed": lambda: StartRealtimeFeed(SYMBOL, Timeframe.ONE_MINUTE),
+        "legacy feed key": lambda: legacy_command_key(feed),
+        "UpdateSettings": lambda: UpdateSettings(
+            SYMBOL, 1, PositionMode.ONE_WAY, MarginMode.ISOLATED
+        ),
+        "legacy settings key": lambda: legacy_command_key(settings),
+    }
+
+    print(f"{'case':<24} {'us/op':>8}")
+
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=NUMBER, repeat=3))
+
+        print(f"{name:<24} {elapsed / NUMBER * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
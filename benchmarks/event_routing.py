@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+from core.events.ohlcv import NewMarketDataReceived
+from core.models.ohlcv import OHLCV
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+from infrastructure.event_dispatcher.event_handler import EventHandler
+from infrastructure.event_dispatcher.handler_executor import HandlerExecutor
+from infrastructure.telemetry.bus_metrics import BusMetrics
+
+NUM_EVENTS = 20_000
+ACTOR_COUNTS = (3, 30, 300, 3000)
+
+
+def make_symbol(name):
+    return Symbol(name, 0.0006, 0.0001, 0.001, 0.01, 3, 2)
+
+
+def make_handler(symbols, routed):
+    handler = EventHandler(HandlerExecutor({}), BusMetrics(), None)
+
+    async def on_receive(event):
+        pass
+
+    for symbol in symbols:
+        key = (symbol, Timeframe.ONE_MINUTE)
+
+        def pre_receive(event, symbol=symbol):
+            return event.symbol == symbol and event.timeframe == Timeframe.ONE_MINUTE
+
+        handler.register(
+            NewMarketDataReceived,
+            on_receive,
+            pre_receive,
+            routing_key=key if routed else None,
+        )
+
+    return handler
+
+
+async def measure(handler, events):
+    start = time.perf_counter()
+
+    for event in events:
+        await handler.handle_event(event)
+
+    return (time.perf_counter() - start) / len(events) * 1e6
+
+
+async def main():
+    print(f"{'actors':>8} {'filter-only':>13} {'routed':>8}  us/event")
+
+    for count in ACTOR_COUNTS:
+        symbols = [make_symbol(f"SYM{i}USDT") for i in range(count)]
+        events = [
+            NewMarketDataReceived(
+                symbols[0],
+                Timeframe.ONE_MINUTE,
+                OHLCV(1700000000000 + i * 60000, 1.0, 2.0, 0.5, 1.5, 10.0),
+                True,
+            )
+            for i in range(NUM_EVENTS)
+        ]
+
+        filtered = await measure(make_handler(symbols, False), events)
+        routed = await measure(make_handler(symbols, True), events)
+
+        print(f"{count:>8} {filtered:>13.2f} {routed:>8.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+import json
+import random
+import time
+
+from core.models.bar import Bar
+from core.models.ohlcv import OHLCV
+from core.models.timeframe import Timeframe
+from exchange._kline_decoder import KlineDecoder
+
+NUM_MESSAGES = 100_000
+NUM_SYMBOLS = 200
+
+INTERVALS = {"1": Timeframe.ONE_MINUTE, "5": Timeframe.FIVE_MINUTES}
+
+
+def make_messages(symbols):
+    messages = []
+
+    for i in range(NUM_MESSAGES):
+        symbol = random.choice(symbols)
+        interval = random.choice(list(INTERVALS))
+        kline = {
+            "start": 1672324980000,
+            "end": 1672325039999,
+            "interval": interval,
+            "open": "16649.5",
+            "close": "16677",
+            "high": "16677",
+            "low": "16608",
+            "volume": "2.081",
+            "turnover": "34666.4005",
+            "confirm": False,
+            "timestamp": 1672324988882 + i,
+        }
+        messages.append(
+            json.dumps(
+                {
+                    "topic": f"kline.{interval}.{symbol}",
+                    "data": [kline],
+                    "ts": 1672324988882 + i,
+                    "type": "snapshot",
+                }
+            )
+        )
+
+    return messages
+
+
+def decode_json(message):
+    data = json.loads(message)
+    _, interval, symbol = data["topic"].split(".")
+
+    return (symbol, INTERVALS[interval]), [
+        Bar(OHLCV.from_dict(ohlcv), ohlcv["confirm"]) for ohlcv in data["data"]
+    ]
+
+
+def measure(name, decode, messages):
+    start = time.perf_counter()
+
+    for message in messages:
+        decode(message)
+
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<12} {len(messages) / elapsed:>12,.0f} msg/s")
+
+
+def main():
+    symbols = [f"SYM{i}USDT" for i in range(NUM_SYMBOLS)]
+    messages = make_messages(symbols)
+
+    decoder = KlineDecoder()
+
+    for symbol in symbols:
+        for interval, timeframe in INTERVALS.items():
+            decoder.register(f"kline.{interval}.{symbol}", (symbol, timeframe))
+
+    measure("json", decode_json, messages)
+    measure("orjson", decoder.decode, messages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+
+from core.events.base import Event, EventMeta
+from infrastructure.event_dispatcher.event_handler import EventHandler
+from infrastructure.event_dispatcher.handler_executor import HandlerExecutor
+from infrastructure.event_dispatcher.load_balancer import LoadBalancer
+from infrastructure.event_dispatcher.weighted_round_robin import WeightedRoundRobin
+from infrastructure.event_dispatcher.worker_pool import WorkerPool
+from infrastructure.telemetry.bus_metrics import BusMetrics
+
+NUM_EVENTS = 20_000
+PRIORITY_GROUPS = 168
+NUM_WORKERS = 4
+QUEUE_SIZE = 8192
+
+SCHEDULERS = {"pid": LoadBalancer, "wrr": WeightedRoundRobin}
+
+
+@dataclass(frozen=True)
+class Tick(Event):
+    meta: EventMeta = field(default_factory=EventMeta, init=False)
+
+
+def make_events(priorities):
+    events = []
+
+    for priority in priorities:
+        event = Tick()
+        event.meta.priority = priority
+        events.append(event)
+
+    return events
+
+
+def measure_scheduler(scheduler, priorities):
+    start = time.perf_counter()
+
+    for priority in priorities:
+        scheduler.register_event(scheduler.determine_priority_group(priority))
+
+    return len(priorities) / (time.perf_counter() - start)
+
+
+async def measure_pool(scheduler, events):
+    async def on_tick(event):
+        pass
+
+    handler = EventHandler(HandlerExecutor({}), BusMetrics(), None)
+    handler.register(Tick, on_tick)
+
+    pool = WorkerPool(
+        NUM_WORKERS,
+        scheduler,
+        handler,
+        asyncio.Event(),
+        QUEUE_SIZE,
+        {},
+        "bench",
+        BusMetrics(),
+    )
+
+    start = time.perf_counter()
+
+    for event in events:
+        await pool.dispatch_to_worker(event)
+
+    await pool.wait()
+
+    elapsed = time.perf_counter() - start
+
+    for worker in pool.workers:
+        worker.tasks.cancel()
+
+    return len(events) / elapsed
+
+
+async def main():
+    priorities = [random.randint(1, 4) for _ in range(NUM_EVENTS)]
+
+    print(f"{'scheduler':<10} {'schedule ev/s':>14} {'dispatch ev/s':>14}")
+
+    for name, scheduler in SCHEDULERS.items():
+        scheduled = measure_scheduler(scheduler(PRIORITY_GROUPS), priorities)
+        dispatched = await measure_pool(
+            scheduler(PRIORITY_GROUPS), make_events(priorities)
+        )
+
+        print(f"{name:<10} {scheduled:>14,.0f} {dispatched:>14,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,3 +1,5 @@
+from typing import List
+
 from core.commands.base import Command
 from core.interfaces.abstract_actor import AbstractActor, Ask, Message
 from core.models.symbol import Symbol
@@ -8,6 +10,7 @@ from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
 
 class Actor(AbstractActor):
     _EVENTS = []
+    _BATCH_EVENTS = []
 
     def __init__(self, symbol: Symbol, timeframe: Timeframe):
         super().__init__()
@@ -28,6 +31,10 @@ class Actor(AbstractActor):
     def timeframe(self):
         return self._timeframe
 
+    @property
+    def routing_key(self):
+        return (self._symbol, self._timeframe)
+
     @property
     def running(self):
         return self._running
@@ -44,12 +51,27 @@ class Actor(AbstractActor):
     def on_receive(self, _msg: Message):
         pass
 
+    async def on_receive_batch(self, msgs: List[Message]):
+        for msg in msgs:
+            await self.on_receive(msg)
+
     def start(self):
         if self.running:
             raise RuntimeError(f"Start: {self.__class__.__name__} is running")
 
         for event in self._EVENTS:
-            self._mailbox.register(event, self.on_receive, self._pre_receive)
+            if event in self._BATCH_EVENTS:
+                self._mailbox.register(
+                    event,
+                    self.on_receive_batch,
+                    self._pre_receive,
+                    self.routing_key,
+                    batch=True,
+                )
+            else:
+                self._mailbox.register(
+                    event, self.on_receive, self._pre_receive, self.routing_key
+                )
 
         self.on_start()
         self._running = True
@@ -59,7 +81,12 @@ class Actor(AbstractActor):
             raise RuntimeError(f"Stop: {self.__class__.__name__} is not started")
 
         for event in self._EVENTS:
-            self._mailbox.unregister(event, self.on_receive)
+            self._mailbox.unregister(
+                event,
+                self.on_receive_batch
+                if event in self._BATCH_EVENTS
+                else self.on_receive,
+            )
 
         self.on_stop()
         self._running = False
@@ -67,6 +94,9 @@ class Actor(AbstractActor):
     async def tell(self, msg: Message, *args, **kwrgs):
         await self._mailbox.dispatch(msg, *args, **kwrgs)
 
+    async def tell_many(self, msgs: List[Message], *args, **kwrgs):
+        await self._mailbox.dispatch_many(msgs, *args, **kwrgs)
+
     async def ask(self, msg: Ask, *args, **kwrgs):
         if isinstance(msg, Query):
             return await self._mailbox.query(msg, *args, **kwrgs)
@@ -1,7 +1,6 @@
 import asyncio
-import hashlib
+import time
 from dataclasses import dataclass, field, fields
-from datetime import datetime, timedelta
 from enum import Enum
 
 from core.events.base import Event, EventMeta
@@ -12,13 +11,18 @@ class CommandGroup(Enum):
     broker = "broker"
     portfolio = "portfolio"
     feed = "feed"
+    system = "system"
 
     def __str__(self):
         return self.value
 
 
+IDEMPOTENCY_WINDOW = 5
+
+
 @dataclass(frozen=True)
 class Command(Event):
+    _idempotent = False
     _execution_event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
     meta: EventMeta = field(default_factory=lambda: EventMeta(priority=1), init=False)
 
@@ -28,23 +32,30 @@ class Command(Event):
     async def wait_for_execution(self):
         await self._execution_event.wait()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_execution_event"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        object.__setattr__(self, "_execution_event", asyncio.Event())
+
     def __post_init__(self):
-        attribute_values = [
+        if self._idempotent:
+            self.meta.key = self._idempotency_key()
+
+    def _idempotency_key(self):
+        attribute_values = tuple(
             getattr(self, field.name)
             for field in fields(self)
             if field.name not in ["meta", "_execution_event"]
-        ]
-        expiration = datetime.now() + timedelta(seconds=5)
-        concatenated = f"{self.__class__.__name__}{attribute_values}{expiration}"
-        idempotency_key = hashlib.sha256(concatenated.encode("utf-8")).hexdigest()
-
-        object.__setattr__(
-            self,
-            "meta",
-            EventMeta(
-                priority=self.meta.priority,
-                group=self.meta.group,
-                version=self.meta.version,
-                key=idempotency_key,
-            ),
         )
+        window = int(time.monotonic() // IDEMPOTENCY_WINDOW)
+
+        try:
+            digest = hash((attribute_values, window))
+        except TypeError:
+            digest = hash((repr(attribute_values), window))
+
+        return (self.__class__.__name__, digest)
@@ -10,6 +10,7 @@ from .base import Command, CommandGroup
 
 @dataclass(frozen=True)
 class BrokerCommand(Command):
+    _idempotent = True
     meta: EventMeta = field(
         default_factory=lambda: EventMeta(priority=1, group=CommandGroup.broker),
         init=False,
@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from core.commands.base import Command, CommandGroup
+from core.events.base import EventMeta
+
+
+@dataclass(frozen=True)
+class ReplayDeadLetters(Command):
+    limit: Optional[int] = None
+    batch_size: Optional[int] = None
+    rate: Optional[float] = None
+    meta: EventMeta = field(
+        default_factory=lambda: EventMeta(priority=8, group=CommandGroup.system),
+        init=False,
+    )
@@ -4,9 +4,11 @@ from functools import partial, wraps
 from typing import Callable, Type
 
 from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+from infrastructure.event_dispatcher.handler_executor import DEFAULT_POOL
 
 from .commands.base import Command
 from .events.base import Event
+from .models.execution import ExecutionPolicy
 from .queries.base import Query
 
 
@@ -25,7 +27,12 @@ def eda(cls: Type):
                 if hasattr(handler, "event"):
                     event_type = handler.event
                     wrapped_handler = partial(handler, self)
-                    self._dispatcher.register(event_type, wrapped_handler)
+                    self._dispatcher.register(
+                        event_type,
+                        wrapped_handler,
+                        policy=handler.policy,
+                        pool=handler.pool,
+                    )
 
                     self._registered_handlers.append((event_type, wrapped_handler))
 
@@ -66,7 +73,11 @@ def eda(cls: Type):
     return Wrapped
 
 
-def event_handler(event_type: Type[Event]) -> Callable[[Callable], Callable]:
+def event_handler(
+    event_type: Type[Event],
+    policy: ExecutionPolicy = ExecutionPolicy.THREAD,
+    pool: str = DEFAULT_POOL,
+) -> Callable[[Callable], Callable]:
     def decorator(handler: Callable) -> Callable:
         if asyncio.iscoroutinefunction(handler):
 
@@ -79,6 +90,8 @@ def event_handler(event_type: Type[Event]) -> Callable[[Callable], Callable]:
                 return handler(self, event)
 
         async_wrapped_handler.event = event_type
+        async_wrapped_handler.policy = policy
+        async_wrapped_handler.pool = pool
         async_wrapped_handler = wraps(handler)(async_wrapped_handler)
 
         return async_wrapped_handler
@@ -86,7 +99,11 @@ def event_handler(event_type: Type[Event]) -> Callable[[Callable], Callable]:
     return decorator
 
 
-def command_handler(command_type: Type[Command]) -> Callable[[Callable], Callable]:
+def command_handler(
+    command_type: Type[Command],
+    policy: ExecutionPolicy = ExecutionPolicy.THREAD,
+    pool: str = DEFAULT_POOL,
+) -> Callable[[Callable], Callable]:
     def decorator(handler: Callable) -> Callable:
         if asyncio.iscoroutinefunction(handler):
 
@@ -99,6 +116,8 @@ def command_handler(command_type: Type[Command]) -> Callable[[Callable], Callabl
                 return handler(self, command)
 
         async_wrapped_handler.event = command_type
+        async_wrapped_handler.policy = policy
+        async_wrapped_handler.pool = pool
         async_wrapped_handler = wraps(handler)(async_wrapped_handler)
 
         return async_wrapped_handler
@@ -106,7 +125,11 @@ def command_handler(command_type: Type[Command]) -> Callable[[Callable], Callabl
     return decorator
 
 
-def query_handler(query_type: Type[Query]) -> Callable[[Callable], Callable]:
+def query_handler(
+    query_type: Type[Query],
+    policy: ExecutionPolicy = ExecutionPolicy.THREAD,
+    pool: str = DEFAULT_POOL,
+) -> Callable[[Callable], Callable]:
     def decorator(handler: Callable) -> Callable:
         if asyncio.iscoroutinefunction(handler):
 
@@ -119,6 +142,8 @@ def query_handler(query_type: Type[Query]) -> Callable[[Callable], Callable]:
                 return handler(self, query)
 
         async_wrapped_handler.event = query_type
+        async_wrapped_handler.policy = policy
+        async_wrapped_handler.pool = pool
         async_wrapped_handler = wraps(handler)(async_wrapped_handler)
 
         return async_wrapped_handler
@@ -1,12 +1,20 @@
-import uuid
+import time
 from dataclasses import asdict, dataclass, field
-from datetime import datetime
 from enum import Enum
+from itertools import count
+
+_sequence = count()
+_origin = time.time_ns()
+
+
+def _timestamp() -> float:
+    return time.time_ns() / 1e9
 
 
 class EventGroup(Enum):
     account = "account"
     backtest = "backtest"
+    dlq = "dlq"
     market = "market"
     portfolio = "portfolio"
     position = "position"
@@ -19,13 +27,18 @@ class EventGroup(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class EventMeta:
-    key: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: int = field(default_factory=lambda: datetime.now().timestamp())
-    priority: int = field(default_factory=lambda: 0)
-    version: int = field(default_factory=lambda: 1)
-    group: EventGroup = field(default_factory=lambda: EventGroup.service)
+    key: int = field(default_factory=_sequence.__next__)
+    timestamp: float = field(default_factory=_timestamp)
+    priority: int = 0
+    version: int = 1
+    group: EventGroup = EventGroup.service
+    origin: int = _origin
+
+    @property
+    def id(self):
+        return (self.origin, self.key)
 
 
 @dataclass(frozen=True)
@@ -35,6 +48,28 @@ class Event:
         res["meta"]["name"] = self.__class__.__name__
         return res
 
+    @property
+    def coalesce_key(self):
+        return None
+
+    @property
+    def routing_key(self):
+        source = (
+            self.signal
+            if hasattr(self, "signal")
+            else self.position.signal
+            if hasattr(self, "position")
+            else self
+        )
+
+        symbol = getattr(source, "symbol", None)
+        timeframe = getattr(source, "timeframe", None)
+
+        if symbol is None or timeframe is None:
+            return None
+
+        return (symbol, timeframe)
+
 
 @dataclass(frozen=True)
 class EventEnded(Event):
@@ -21,3 +21,7 @@ class NewMarketDataReceived(MarketEvent):
     timeframe: Timeframe
     ohlcv: OHLCV
     closed: bool
+
+    @property
+    def coalesce_key(self):
+        return None if self.closed else (self.symbol, self.timeframe)
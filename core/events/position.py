@@ -13,15 +13,6 @@ class PositionEvent(Event):
         init=False,
     )
 
-    def to_dict(self):
-        parent_dict = super().to_dict()
-
-        current_dict = {
-            "position": self.position.to_dict(),
-        }
-
-        return {**parent_dict, **current_dict}
-
 
 @dataclass(frozen=True)
 class PositionInitialized(PositionEvent):
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 
 from core.models.ohlcv import OHLCV
 from core.models.signal import Signal
@@ -21,31 +21,11 @@ class SignalEntryEvent(SignalEvent):
     entry_price: float
     stop_loss: float
 
-    def to_dict(self):
-        parent_dict = super().to_dict()
-
-        current_dict = {
-            "signal": self.signal.to_dict(),
-            "entry_price": self.entry_price,
-            "stop_loss": self.stop_loss,
-            "ohlcv": asdict(self.ohlcv),
-        }
-
-        return {**parent_dict, **current_dict}
-
 
 @dataclass(frozen=True)
 class SignalExitEvent(SignalEvent):
     exit_price: float
 
-    def to_dict(self):
-        return {
-            "signal": self.signal.to_dict(),
-            "exit_price": self.exit_price,
-            "ohlcv": asdict(self.ohlcv),
-            "meta": asdict(self.meta),
-        }
-
 
 @dataclass(frozen=True)
 class GoLongSignalReceived(SignalEntryEvent):
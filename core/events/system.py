@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, List
 
 from core.events.base import Event, EventGroup, EventMeta
 from core.models.strategy import Strategy
@@ -16,3 +16,16 @@ class SystemEvent(Event):
 @dataclass(frozen=True)
 class DeployStrategy(SystemEvent):
     strategy: List[Strategy]
+
+
+@dataclass(frozen=True)
+class DeadLetter(Event):
+    event: Any
+    handler: str
+    error: str
+    message: str
+    traceback: str
+    meta: EventMeta = field(
+        default_factory=lambda: EventMeta(priority=8, group=EventGroup.dlq),
+        init=False,
+    )
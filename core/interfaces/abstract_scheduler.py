@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractScheduler(ABC):
+    @abstractmethod
+    def determine_priority_group(self, priority: int) -> int:
+        pass
+
+    @abstractmethod
+    def register_event(self, priority_group: int):
+        pass
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class BackpressurePolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+    def __str__(self):
+        return self.value
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class Compression(Enum):
+    GZIP = "gzip"
+    LZMA = "lzma"
+
+    def __str__(self):
+        return self.value
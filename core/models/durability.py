@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class Durability(Enum):
+    BUFFERED = "buffered"
+    FSYNC = "fsync"
+
+    def __str__(self):
+        return self.value
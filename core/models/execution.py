@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+
+class ExecutionPolicy(Enum):
+    INLINE = auto()
+    THREAD = auto()
+    PROCESS = auto()
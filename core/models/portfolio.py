@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import cached_property
+from typing import Optional
 
 import numpy as np
 from scipy.stats import kurtosis, norm, skew
@@ -16,26 +18,26 @@ class Performance:
     _fee: np.array = field(default_factory=lambda: np.array([], dtype=np.float64))
     updated_at: float = field(default_factory=lambda: datetime.now().timestamp())
 
-    @property
+    @cached_property
     def total_trades(self) -> int:
         return self._pnl.size
 
-    @property
+    @cached_property
     def total_pnl(self) -> float:
         return np.sum(self._pnl)
 
-    @property
+    @cached_property
     def total_fee(self) -> float:
         return np.sum(self._fee)
 
-    @property
+    @cached_property
     def average_pnl(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
 
         return np.mean(self._pnl)
 
-    @property
+    @cached_property
     def average_win(self) -> float:
         win = self._pnl[self._pnl > 0]
 
@@ -44,7 +46,7 @@ class Performance:
 
         return np.mean(win)
 
-    @property
+    @cached_property
     def average_loss(self) -> float:
         loss = self._pnl[self._pnl < 0]
 
@@ -53,15 +55,15 @@ class Performance:
 
         return np.mean(loss)
 
-    @property
+    @cached_property
     def max_consecutive_wins(self) -> int:
         return self._max_streak(self._pnl, True)
 
-    @property
+    @cached_property
     def max_consecutive_losses(self) -> int:
         return self._max_streak(self._pnl, False)
 
-    @property
+    @cached_property
     def hit_ratio(self) -> float:
         total_trades = self.total_trades
 
@@ -70,11 +72,11 @@ class Performance:
 
         return np.divide(np.sum(self._pnl > 0), total_trades)
 
-    @property
+    @cached_property
     def equity(self):
         return [self._account_size] + self._pnl.cumsum()
 
-    @property
+    @cached_property
     def drawdown(self):
         equity_curve = self.equity
 
@@ -85,7 +87,7 @@ class Performance:
 
         return np.divide(peak - equity_curve, peak)
 
-    @property
+    @cached_property
     def runup(self) -> float:
         equity_curve = self.equity
 
@@ -96,15 +98,15 @@ class Performance:
 
         return np.divide(equity_curve - trough, trough)
 
-    @property
+    @cached_property
     def max_runup(self) -> float:
         return np.max(self.runup)
 
-    @property
+    @cached_property
     def max_drawdown(self) -> float:
         return np.max(self.drawdown)
 
-    @property
+    @cached_property
     def calmar_ratio(self) -> float:
         max_drawdown = self.max_drawdown
 
@@ -113,7 +115,7 @@ class Performance:
 
         return np.divide(self.cagr, np.abs(max_drawdown))
 
-    @property
+    @cached_property
     def sharpe_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -125,7 +127,7 @@ class Performance:
 
         return np.divide(self.average_pnl, std_return)
 
-    @property
+    @cached_property
     def smart_sharpe_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -138,7 +140,7 @@ class Performance:
 
         return np.divide(self.average_pnl, std_return * penalty)
 
-    @property
+    @cached_property
     def deflated_sharpe_ratio(self) -> float:
         total_trades = self.total_trades
 
@@ -169,7 +171,7 @@ class Performance:
             )
         )
 
-    @property
+    @cached_property
     def sortino_ratio(self) -> float:
         total_trades = self.total_trades
 
@@ -188,7 +190,7 @@ class Performance:
 
         return np.divide(self.average_pnl, downside)
 
-    @property
+    @cached_property
     def smart_sortino_ratio(self) -> float:
         total_trades = self.total_trades
 
@@ -208,7 +210,7 @@ class Performance:
 
         return np.divide(self.average_pnl, downside * penalty)
 
-    @property
+    @cached_property
     def payoff_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -220,7 +222,7 @@ class Performance:
 
         return np.divide(self.average_win, denom)
 
-    @property
+    @cached_property
     def cagr(self) -> float:
         periods = self.total_trades
 
@@ -246,7 +248,7 @@ class Performance:
 
         return np.power(compound_factor, time_factor) - 1
 
-    @property
+    @cached_property
     def optimal_f(self) -> float:
         total_trades = self.total_trades
 
@@ -264,7 +266,7 @@ class Performance:
 
         return np.divide(max_loss, np.abs(initial_value)) * np.sqrt(growth_factor)
 
-    @property
+    @cached_property
     def kelly(self) -> float:
         total_trades = self.total_trades
 
@@ -280,11 +282,11 @@ class Performance:
 
         return win_prob - np.divide(1 - win_prob, wl_ratio)
 
-    @property
+    @cached_property
     def ann_sharpe_ratio(self) -> float:
         return self.sharpe_ratio * np.sqrt(self._periods_per_year)
 
-    @property
+    @cached_property
     def expected_return(self) -> float:
         total_trades = self.total_trades
 
@@ -303,7 +305,7 @@ class Performance:
 
         return np.exp(log_prod / total_trades) - 1.0
 
-    @property
+    @cached_property
     def ann_volatility(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -314,7 +316,7 @@ class Performance:
 
         return volatility * np.sqrt(self._periods_per_year)
 
-    @property
+    @cached_property
     def recovery_factor(self) -> float:
         max_drawdown = self.max_drawdown
 
@@ -325,7 +327,7 @@ class Performance:
 
         return np.divide(total_profit, max_drawdown)
 
-    @property
+    @cached_property
     def profit_factor(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -343,7 +345,7 @@ class Performance:
 
         return np.divide(gross_profit, gross_loss)
 
-    @property
+    @cached_property
     def risk_of_ruin(self) -> float:
         total_trades = self.total_trades
 
@@ -354,21 +356,21 @@ class Performance:
 
         return np.divide(1 - win_rate, 1 + win_rate) ** total_trades
 
-    @property
+    @cached_property
     def skew(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
 
         return skew(self._pnl, bias=False)
 
-    @property
+    @cached_property
     def kurtosis(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
 
         return kurtosis(self._pnl, bias=False)
 
-    @property
+    @cached_property
     def var(self, confidence_level=0.95) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -378,7 +380,7 @@ class Performance:
 
         return norm.ppf(1.0 - confidence_level, mu, sigma)
 
-    @property
+    @cached_property
     def cvar(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -391,7 +393,7 @@ class Performance:
 
         return np.mean(pnl)
 
-    @property
+    @cached_property
     def ulcer_index(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -403,7 +405,7 @@ class Performance:
 
         return np.sqrt(np.mean(drawdown**2))
 
-    @property
+    @cached_property
     def upi(self) -> float:
         ulcer_index = self.ulcer_index
 
@@ -412,21 +414,21 @@ class Performance:
 
         return np.divide(self.expected_return, ulcer_index)
 
-    @property
+    @cached_property
     def common_sense_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
 
         return self.profit_factor * self.tail_ratio
 
-    @property
+    @cached_property
     def cpc_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
 
         return self.profit_factor * self.hit_ratio * self.payoff_ratio
 
-    @property
+    @cached_property
     def lake_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -442,7 +444,7 @@ class Performance:
 
         return 1 - underwater_time
 
-    @property
+    @cached_property
     def burke_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -454,7 +456,7 @@ class Performance:
 
         return np.divide(self.cagr, downside_deviation)
 
-    @property
+    @cached_property
     def rachev_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -475,7 +477,7 @@ class Performance:
 
         return np.divide(np.abs(self.average_pnl), expected_shortfall)
 
-    @property
+    @cached_property
     def sterling_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -493,7 +495,7 @@ class Performance:
 
         return np.divide(upside_potential, downside_risk)
 
-    @property
+    @cached_property
     def tail_ratio(self, cutoff=95) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -505,7 +507,7 @@ class Performance:
 
         return np.abs(np.divide(np.percentile(self._pnl, cutoff), denom))
 
-    @property
+    @cached_property
     def omega_ratio(self) -> float:
         if self.total_trades < TOTAL_TRADES_THRESHOLD:
             return 0
@@ -522,7 +524,7 @@ class Performance:
 
         return np.divide(np.sum(gains), sum_losses)
 
-    @property
+    @cached_property
     def kappa_three_ratio(self) -> float:
         total_trades = self.total_trades
 
@@ -548,11 +550,16 @@ class Performance:
 
         return np.divide((up_proportion**3 - down_proportion), denom)
 
-    def next(self, pnl: float, fee: float) -> "Performance":
+    def next(
+        self, pnl: float, fee: float, updated_at: Optional[float] = None
+    ) -> "Performance":
         _pnl, _fee = np.append(self._pnl, pnl), np.append(self._fee, fee)
 
         return replace(
-            self, _pnl=_pnl, _fee=_fee, updated_at=datetime.now().timestamp()
+            self,
+            _pnl=_pnl,
+            _fee=_fee,
+            updated_at=updated_at or datetime.now().timestamp(),
         )
 
     @staticmethod
@@ -609,10 +616,9 @@ class Performance:
             "max_consecutive_wins": self.max_consecutive_wins,
             "max_consecutive_losses": self.max_consecutive_losses,
             "hit_ratio": self.hit_ratio,
-            "equity": self.equity,
-            "runup": self.runup,
+            "pnl": self._pnl[-1] if self.total_trades else 0.0,
+            "fee": self._fee[-1] if self.total_trades else 0.0,
             "max_runup": self.max_runup,
-            "drawdown": self.drawdown,
             "max_drawdown": self.max_drawdown,
             "sharpe_ratio": self.sharpe_ratio,
             "smart_sharpe_ratio": self.smart_sharpe_ratio,
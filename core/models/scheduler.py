@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class SchedulerType(Enum):
+    PID = "pid"
+    WRR = "wrr"
+
+    def __str__(self):
+        return self.value
@@ -13,6 +13,7 @@ class QueryGroup(Enum):
     broker = "broker"
     position = "position"
     portfolio = "portfolio"
+    system = "system"
 
     def __str__(self):
         return self.value
@@ -31,3 +32,14 @@ class Query(Generic[T], Event):
     async def wait_for_response(self) -> T:
         await self._response_event.wait()
         return self._response
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_response_event"]
+        del state["_response"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        object.__setattr__(self, "_response_event", asyncio.Event())
+        object.__setattr__(self, "_response", None)
@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from core.events.base import EventMeta
+from core.events.system import DeadLetter
+
+from .base import Query, QueryGroup
+
+
+@dataclass(frozen=True)
+class GetBusMetrics(Query[dict]):
+    meta: EventMeta = field(
+        default_factory=lambda: EventMeta(priority=8, group=QueryGroup.system),
+        init=False,
+    )
+
+
+@dataclass(frozen=True)
+class GetDeadLetters(Query[List[DeadLetter]]):
+    since: Optional[float] = None
+    limit: Optional[int] = None
+    pending: bool = True
+    meta: EventMeta = field(
+        default_factory=lambda: EventMeta(priority=8, group=QueryGroup.system),
+        init=False,
+    )
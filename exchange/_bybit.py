@@ -1,7 +1,11 @@
 import logging
 import math
-from collections import defaultdict
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 
 import ccxt
 from cachetools import TTLCache, cached
@@ -9,13 +13,17 @@ from ccxt.base.errors import NetworkError, RequestTimeout
 
 from core.interfaces.abstract_exchange import AbstractExchange
 from core.models.broker import MarginMode, PositionMode
+from core.models.exchange import ExchangeType
 from core.models.lookback import TIMEFRAMES_TO_LOOKBACK, Lookback
 from core.models.side import PositionSide
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
+from infrastructure.ohlcv_store.ohlcv_store import OHLCVStore
 from infrastructure.retry import retry
 
 MAX_RETRIES = 13
+MAX_CONCURRENT_REQUESTS = 8
+MAX_PAGE_SIZE = 1000
 EXCEPTIONS = (RequestTimeout, NetworkError)
 
 
@@ -25,15 +33,21 @@ logger = logging.getLogger(__name__)
 class Bybit(AbstractExchange):
     _instance = None
 
-    def __new__(cls, api_key: str, api_secret: str):
+    def __new__(cls, api_key: str, api_secret: str, ohlcv_store: OHLCVStore):
         if not cls._instance:
             cls._instance = super(Bybit, cls).__new__(cls)
-            cls._instance._initialize(api_key, api_secret)
+            cls._instance._initialize(api_key, api_secret, ohlcv_store)
         return cls._instance
 
-    def _initialize(self, api_key: str, api_secret: str):
+    def _initialize(self, api_key: str, api_secret: str, ohlcv_store: OHLCVStore):
         self.connector = ccxt.bybit({"apiKey": api_key, "secret": api_secret})
         self.connector.load_markets()
+        self.ohlcv_store = ohlcv_store
+        self._download_pool = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="bybit-ohlcv"
+        )
+        self._throttle_lock = threading.Lock()
+        self._next_request_time = 0.0
 
     def update_symbol_settings(
         self,
@@ -262,41 +276,132 @@ class Bybit(AbstractExchange):
         )
 
         lookback = in_sample + out_sample
+        timeframe_ms = self.connector.parse_timeframe(timeframe.value) * 1000
+        current_time = self.connector.milliseconds()
 
-        start_time = (
-            self.connector.milliseconds()
-            - lookback * self.connector.parse_timeframe(timeframe.value) * 1000
-        )
+        start_time = current_time - lookback * timeframe_ms
+        start_time += -start_time % timeframe_ms
+
+        max_time = start_time + in_sample * timeframe_ms
+        closed_time = current_time - current_time % timeframe_ms
+        end_time = min(max_time, closed_time)
+
+        key = (ExchangeType.BYBIT, symbol, timeframe)
+
+        with self.ohlcv_store.lock(key):
+            for range_start, range_end in self.ohlcv_store.missing(
+                key, start_time, end_time
+            ):
+                self.ohlcv_store.write(
+                    key,
+                    self._fetch_range(
+                        symbol, timeframe, range_start, range_end, batch_size
+                    ),
+                    range_start,
+                    range_end,
+                )
+
+            columns = self.ohlcv_store.read(key, start_time, end_time)
+
+        timestamps, *prices = (column.tolist() for column in columns)
+
+        yield from zip(timestamps, *prices, strict=True)
+
+        if max_time > closed_time:
+            yield from self._fetch_range(
+                symbol, timeframe, closed_time, max_time, batch_size
+            )
+
+    def _fetch_range(
+        self,
+        symbol: Symbol,
+        timeframe: Timeframe,
+        start_time: int,
+        end_time: int,
+        batch_size: int,
+    ):
+        timeframe_ms = self.connector.parse_timeframe(timeframe.value) * 1000
+        page_ms = min(batch_size, MAX_PAGE_SIZE) * timeframe_ms
 
-        max_time = (
-            start_time
-            + in_sample * self.connector.parse_timeframe(timeframe.value) * 1000
+        pages = (
+            (page_start, min(page_start + page_ms, end_time))
+            for page_start in range(start_time, end_time, page_ms)
         )
 
-        fetched_ohlcv = 0
+        last_timestamp = None
+
+        for page in self._fetch_pages(symbol, timeframe, pages, timeframe_ms):
+            for data in page:
+                if last_timestamp is not None and data[0] <= last_timestamp:
+                    continue
+
+                last_timestamp = data[0]
+
+                yield data
+
+    def _fetch_pages(self, symbol, timeframe, pages, timeframe_ms):
+        futures = deque(
+            self._download_pool.submit(
+                self._fetch_page, symbol, timeframe, page_start, page_end, timeframe_ms
+            )
+            for page_start, page_end in islice(pages, MAX_CONCURRENT_REQUESTS)
+        )
 
-        while fetched_ohlcv < in_sample:
-            current_limit = min(in_sample - fetched_ohlcv, batch_size)
+        try:
+            while futures:
+                page = futures.popleft().result()
+
+                for page_start, page_end in islice(pages, 1):
+                    futures.append(
+                        self._download_pool.submit(
+                            self._fetch_page,
+                            symbol,
+                            timeframe,
+                            page_start,
+                            page_end,
+                            timeframe_ms,
+                        )
+                    )
+
+                yield page
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _fetch_page(self, symbol, timeframe, page_start, page_end, timeframe_ms):
+        page = []
+
+        while page_start < page_end:
+            self._throttle()
 
             current_ohlcv = self._fetch_ohlcv(
-                symbol, timeframe, start_time, current_limit
+                symbol,
+                timeframe,
+                page_start,
+                math.ceil((page_end - page_start) / timeframe_ms),
             )
 
             if not current_ohlcv:
                 break
 
-            for data in current_ohlcv:
-                yield data
+            page.extend(
+                data for data in current_ohlcv if page_start <= data[0] < page_end
+            )
+
+            page_start = current_ohlcv[-1][0] + timeframe_ms
 
-                fetched_ohlcv += 1
+        return page
 
-            start_time = (
-                current_ohlcv[-1][0]
-                + self.connector.parse_timeframe(timeframe.value) * 1000
+    def _throttle(self):
+        with self._throttle_lock:
+            now = time.monotonic()
+            delay = self._next_request_time - now
+            self._next_request_time = (
+                max(now, self._next_request_time) + self.connector.rateLimit / 1000
             )
 
-            if start_time >= max_time:
-                break
+        if delay > 0:
+            time.sleep(delay)
 
     @retry(max_retries=MAX_RETRIES, handled_exceptions=EXCEPTIONS)
     def _fetch_ohlcv(self, symbol, timeframe, start_time, current_limit):
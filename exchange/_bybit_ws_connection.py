@@ -0,0 +1,249 @@
+import asyncio
+import json
+import logging
+import time
+from asyncio.exceptions import CancelledError
+
+import websockets
+from websockets.exceptions import ConnectionClosedError
+
+from core.models.timeframe import Timeframe
+from infrastructure.bar_queue import BarQueue
+from infrastructure.retry import retry
+from infrastructure.telemetry.latency_histogram import LatencyHistogram
+
+from ._kline_decoder import KlineDecoder
+
+logger = logging.getLogger(__name__)
+
+
+class BybitWSConnection:
+    SUBSCRIBE_OPERATION = "subscribe"
+    UNSUBSCRIBE_OPERATION = "unsubscribe"
+    PING_OPERATION = "ping"
+    INTERVALS = {
+        Timeframe.ONE_MINUTE: 1,
+        Timeframe.THREE_MINUTES: 3,
+        Timeframe.FIVE_MINUTES: 5,
+        Timeframe.FIFTEEN_MINUTES: 15,
+        Timeframe.ONE_HOUR: 60,
+        Timeframe.FOUR_HOURS: 240,
+    }
+
+    TIMEFRAMES = {
+        "1": Timeframe.ONE_MINUTE,
+        "3": Timeframe.THREE_MINUTES,
+        "5": Timeframe.FIVE_MINUTES,
+        "15": Timeframe.FIFTEEN_MINUTES,
+        "60": Timeframe.ONE_HOUR,
+        "240": Timeframe.FOUR_HOURS,
+    }
+
+    KLINE_CHANNEL = "kline"
+
+    def __init__(self, wss: str, name: str, queue_size: int):
+        self.ws = None
+        self.wss = wss
+        self.name = name
+        self.queue_size = queue_size
+        self.lag = LatencyHistogram()
+        self.messages = 0
+        self.reconnects = 0
+
+        self._channels = set()
+        self.decoder = KlineDecoder()
+        self._queues = {}
+        self._reader = None
+        self._closing = False
+        self._lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def channels(self):
+        return self._channels
+
+    async def _connect_to_websocket(self):
+        self.ws = await websockets.connect(
+            self.wss,
+            open_timeout=None,
+            ping_interval=30,
+            ping_timeout=15,
+            close_timeout=None,
+        )
+
+        await self._resubscribe()
+
+    @retry(
+        max_retries=13,
+        initial_retry_delay=1,
+        handled_exceptions=(
+            ConnectionError,
+            RuntimeError,
+            ConnectionClosedError,
+            CancelledError,
+        ),
+    )
+    async def _reconnect(self):
+        if self._closing:
+            return
+
+        await self._close_socket()
+        await self._connect_to_websocket()
+
+    async def run(self):
+        async with self._connect_lock:
+            self._closing = False
+
+            if not self.ws or not self.ws.open:
+                await self._reconnect()
+
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read())
+
+    async def close(self):
+        self._closing = True
+
+        reader, self._reader = self._reader, None
+
+        if reader is not None and reader is not asyncio.current_task():
+            reader.cancel()
+
+            await asyncio.gather(reader, return_exceptions=True)
+
+        await self._close_socket()
+
+    async def _close_socket(self):
+        if not self.ws or not self.ws.open:
+            return
+
+        await self.ws.close()
+
+    async def receive(self, symbol, timeframe):
+        item = await self._get_queue((symbol, timeframe)).get()
+
+        if isinstance(item, Exception):
+            raise item
+
+        return item
+
+    async def _read(self):
+        while not self._closing:
+            try:
+                async for message in self.ws:
+                    try:
+                        self._route(message)
+                    except Exception as e:
+                        logger.error(f"Failed to route message {message}: {e}")
+            except ConnectionClosedError as e:
+                logger.error(f"Websocket connection closed: {e}")
+
+            if self._closing:
+                return
+
+            try:
+                async with self._connect_lock:
+                    if not self.ws or not self.ws.open:
+                        self.reconnects += 1
+                        await self._reconnect()
+            except Exception as e:
+                logger.error(f"Websocket reader stopped: {e}")
+
+                for queue in self._queues.values():
+                    queue.put_nowait(e)
+
+                return
+
+    def _route(self, message):
+        decoded = self.decoder.decode(message)
+
+        if decoded is None:
+            return
+
+        key, bars, sent = decoded
+        queue = self._queues.get(key)
+
+        if queue is None:
+            return
+
+        self.messages += 1
+
+        if sent is not None:
+            self.lag.record(max(time.time() - sent / 1000, 0.0))
+
+        for bar in bars:
+            queue.put_nowait(bar)
+
+    def _get_queue(self, key) -> BarQueue:
+        if key not in self._queues:
+            self._queues[key] = BarQueue(self.queue_size)
+
+        return self._queues[key]
+
+    @classmethod
+    def get_channel(cls, symbol, timeframe) -> str:
+        return f"{cls.KLINE_CHANNEL}.{cls.INTERVALS[timeframe]}.{symbol.name}"
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "connected": bool(self.ws and self.ws.open),
+            "channels": len(self._channels),
+            "messages": self.messages,
+            "dropped": sum(queue.dropped for queue in self._queues.values()),
+            "reconnects": self.reconnects,
+            "backlog": sum(queue.qsize() for queue in self._queues.values()),
+            "lag": self.lag.snapshot(),
+        }
+
+    async def subscribe(self, symbol, timeframe):
+        async with self._lock:
+            if (symbol, timeframe) not in self._channels:
+                self._channels.add((symbol, timeframe))
+                self.decoder.register(
+                    self.get_channel(symbol, timeframe), (symbol, timeframe)
+                )
+                self._get_queue((symbol, timeframe))
+                await self._subscribe(symbol, timeframe)
+
+    async def unsubscribe(self, symbol, timeframe):
+        async with self._lock:
+            if (symbol, timeframe) in self._channels:
+                self._channels.remove((symbol, timeframe))
+                self.decoder.unregister(self.get_channel(symbol, timeframe))
+                queue = self._queues.pop((symbol, timeframe), None)
+
+                if queue is not None:
+                    queue.put_nowait(StopAsyncIteration())
+
+                await self._unsubscribe(symbol, timeframe)
+
+    async def _subscribe(self, symbol, timeframe):
+        if not self.ws or not self.ws.open:
+            return
+
+        channel = self.get_channel(symbol, timeframe)
+        subscribe_message = {"op": self.SUBSCRIBE_OPERATION, "args": [channel]}
+
+        try:
+            logger.info(f"Subscribe to: {subscribe_message}")
+            await self.ws.send(json.dumps(subscribe_message))
+        except Exception as e:
+            logger.error(e)
+
+    async def _unsubscribe(self, symbol, timeframe):
+        if not self.ws or not self.ws.open:
+            return
+
+        channel = self.get_channel(symbol, timeframe)
+        unsubscribe_message = {"op": self.UNSUBSCRIBE_OPERATION, "args": [channel]}
+
+        try:
+            logger.info(f"Unsubscribe from: {unsubscribe_message}")
+            await self.ws.send(json.dumps(unsubscribe_message))
+        except Exception as e:
+            logger.error(e)
+
+    async def _resubscribe(self):
+        async with self._lock:
+            for symbol, timeframe in self._channels:
+                await self._subscribe(symbol, timeframe)
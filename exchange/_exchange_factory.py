@@ -1,16 +1,19 @@
+from core.interfaces.abstract_config import AbstractConfig
 from core.interfaces.abstract_exchange import AbstractExchange
 from core.interfaces.abstract_exhange_factory import AbstractExchangeFactory
 from core.interfaces.abstract_secret_service import AbstractSecretService
 from core.models.exchange import ExchangeType
 from exchange._bybit import Bybit
+from infrastructure.ohlcv_store.ohlcv_store import OHLCVStore
 
 
 class ExchangeFactory(AbstractExchangeFactory):
     _exchange_type = {ExchangeType.BYBIT: Bybit}
 
-    def __init__(self, secret: AbstractSecretService):
+    def __init__(self, secret: AbstractSecretService, config_service: AbstractConfig):
         super().__init__()
         self.secret = secret
+        self.config_service = config_service
 
     def create(self, type: ExchangeType) -> AbstractExchange:
         if type not in self._exchange_type:
@@ -21,4 +24,4 @@ class ExchangeFactory(AbstractExchangeFactory):
         api_key = self.secret.get_api_key(type.name)
         api_secret = self.secret.get_secret(type.name)
 
-        return exchange(api_key, api_secret)
+        return exchange(api_key, api_secret, OHLCVStore(self.config_service))
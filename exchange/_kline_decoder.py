@@ -0,0 +1,51 @@
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import orjson
+
+from core.models.bar import Bar
+from core.models.ohlcv import OHLCV
+
+
+class KlineDecoder:
+    TOPIC_KEY = "topic"
+    DATA_KEY = "data"
+    CONFIRM_KEY = "confirm"
+    TIMESTAMP_KEY = "timestamp"
+    SENT_KEY = "ts"
+
+    def __init__(self):
+        self._topics: Dict[str, Hashable] = {}
+
+    def register(self, topic: str, key: Hashable) -> None:
+        self._topics[topic] = key
+
+    def unregister(self, topic: str) -> None:
+        self._topics.pop(topic, None)
+
+    def decode(
+        self, message: bytes | str
+    ) -> Optional[Tuple[Hashable, List[Bar], Optional[int]]]:
+        data = orjson.loads(message)
+        key = self._topics.get(data.get(self.TOPIC_KEY))
+
+        if key is None:
+            return None
+
+        return (
+            key,
+            [
+                Bar(
+                    OHLCV(
+                        int(kline[self.TIMESTAMP_KEY]),
+                        float(kline["open"]),
+                        float(kline["high"]),
+                        float(kline["low"]),
+                        float(kline["close"]),
+                        float(kline["volume"]),
+                    ),
+                    kline[self.CONFIRM_KEY],
+                )
+                for kline in data[self.DATA_KEY]
+            ],
+            data.get(self.SENT_KEY),
+        )
@@ -1,3 +1,4 @@
+from core.interfaces.abstract_config import AbstractConfig
 from core.interfaces.abstract_exchange import AbstractExchange
 from core.interfaces.abstract_exhange_factory import AbstractExchangeFactory
 from core.interfaces.abstract_secret_service import AbstractSecretService
@@ -9,9 +10,11 @@ from ._bybit_ws import BybitWS
 class WSFactory(AbstractExchangeFactory):
     _type = {ExchangeType.BYBIT: BybitWS}
 
-    def __init__(self, secret: AbstractSecretService):
+    def __init__(self, secret: AbstractSecretService, config_service: AbstractConfig):
         super().__init__()
         self.secret = secret
+        self.config_service = config_service
+        self.instances = {}
 
     def create(self, type: ExchangeType) -> AbstractExchange:
         if type not in self._type:
@@ -19,5 +22,16 @@ class WSFactory(AbstractExchangeFactory):
 
         ws = self._type.get(type)
         wss = self.secret.get_wss(type.name)
+        config = self.config_service.get("ws")
 
-        return ws(wss)
+        self.instances[type] = ws(
+            wss,
+            config["num_connections"],
+            config["queue_size"],
+            config["virtual_nodes"],
+        )
+
+        return self.instances[type]
+
+    def stats(self) -> dict:
+        return {type.name.lower(): ws.stats() for type, ws in self.instances.items()}
@@ -1,6 +1,7 @@
 from core.interfaces.abstract_config import AbstractConfig
 from core.interfaces.abstract_exhange_factory import AbstractExchangeFactory
 from core.interfaces.abstract_feed_actor_factory import AbstractFeedActorFactory
+from core.interfaces.abstract_ws import AbstractWS
 from core.models.exchange import ExchangeType
 from core.models.feed import FeedType
 from core.models.symbol import Symbol
@@ -8,6 +9,7 @@ from core.models.timeframe import Timeframe
 
 from ._historical import HistoricalActor
 from ._realtime import RealtimeActor
+from ._resampler import ResamplingWS
 
 
 class FeedActorFactory(AbstractFeedActorFactory):
@@ -20,6 +22,13 @@ class FeedActorFactory(AbstractFeedActorFactory):
         self.config_service = config_service
         self.exchange_factory = exchange_factory
         self.ws_factory = ws_factory
+        self.config = config_service.get("feed")
+        self.base_timeframe = (
+            Timeframe.from_raw(self.config["base_timeframe"])
+            if self.config.get("resample", 0)
+            else None
+        )
+        self.resampling_ws = {}
 
     def create_actor(
         self,
@@ -34,13 +43,27 @@ class FeedActorFactory(AbstractFeedActorFactory):
                 timeframe,
                 self.exchange_factory.create(exchange_type),
                 self.config_service,
+                self.base_timeframe,
             )
             if feed_type == FeedType.HISTORICAL
             else RealtimeActor(
                 symbol,
                 timeframe,
-                self.ws_factory.create(exchange_type),
+                self._create_ws(exchange_type),
             )
         )
         actor.start()
         return actor
+
+    def _create_ws(self, exchange_type: ExchangeType) -> AbstractWS:
+        ws = self.ws_factory.create(exchange_type)
+
+        if self.base_timeframe is None:
+            return ws
+
+        if exchange_type not in self.resampling_ws:
+            self.resampling_ws[exchange_type] = ResamplingWS(
+                ws, self.base_timeframe, self.config["queue_size"]
+            )
+
+        return self.resampling_ws[exchange_type]
@@ -1,4 +1,5 @@
 import asyncio
+from itertools import islice
 
 from core.actors import Actor
 from core.commands.feed import StartHistoricalFeed
@@ -11,6 +12,8 @@ from core.models.ohlcv import OHLCV
 from core.models.symbol import Symbol
 from core.models.timeframe import Timeframe
 
+from ._resampler import resample
+
 
 class AsyncHistoricalData:
     def __init__(
@@ -21,6 +24,8 @@ class AsyncHistoricalData:
         in_sample: Lookback,
         out_sample: Lookback,
         batch_size: int,
+        read_ahead: int,
+        base_timeframe: Timeframe | None = None,
     ):
         self.exchange = exchange
         self.symbol = symbol
@@ -28,21 +33,45 @@ class AsyncHistoricalData:
         self.in_sample = in_sample
         self.out_sample = out_sample
         self.batch_size = batch_size
+        self.read_ahead = read_ahead
+        self.base_timeframe = base_timeframe
         self.iterator = None
+        self.chunks = None
+        self.prefetch_task = None
+        self.current_chunk = iter(())
         self.sentinel = object()
         self.last_row = None
 
     async def __aenter__(self):
-        self.iterator = self.exchange.fetch_ohlcv(
-            self.symbol,
-            self.timeframe,
-            self.in_sample,
-            self.out_sample,
-            self.batch_size,
-        )
+        if self.base_timeframe and self.base_timeframe != self.timeframe:
+            self.iterator = resample(
+                self.exchange.fetch_ohlcv(
+                    self.symbol,
+                    self.base_timeframe,
+                    self.in_sample,
+                    self.out_sample,
+                    self.batch_size,
+                ),
+                self.timeframe,
+                self.base_timeframe,
+            )
+        else:
+            self.iterator = self.exchange.fetch_ohlcv(
+                self.symbol,
+                self.timeframe,
+                self.in_sample,
+                self.out_sample,
+                self.batch_size,
+            )
+        self.chunks = asyncio.Queue(maxsize=max(1, self.read_ahead))
+        self.prefetch_task = asyncio.create_task(self._prefetch())
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
+        if self.prefetch_task:
+            self.prefetch_task.cancel()
+
+        self.prefetch_task = None
         self.iterator = None
         return self
 
@@ -50,22 +79,56 @@ class AsyncHistoricalData:
         return self
 
     async def __anext__(self):
-        next_item = await self._fetch_next_item()
+        next_item = next(self.current_chunk, self.sentinel)
 
         if next_item is self.sentinel:
-            raise StopAsyncIteration
+            chunk = await self._fetch_next_chunk()
+
+            if chunk is self.sentinel:
+                raise StopAsyncIteration
+
+            self.current_chunk = iter(chunk)
+            next_item = next(self.current_chunk)
 
         self.last_row = next_item
         return next_item
 
-    async def _fetch_next_item(self):
-        return await asyncio.to_thread(self._next_item_or_end)
+    async def batches(self):
+        while True:
+            chunk = await self._fetch_next_chunk()
+
+            if chunk is self.sentinel:
+                break
+
+            self.last_row = chunk[-1]
+            yield chunk
 
-    def _next_item_or_end(self):
+    async def _prefetch(self):
         try:
-            return Bar(OHLCV.from_list(next(self.iterator)), True)
-        except StopIteration:
-            return self.sentinel
+            while True:
+                chunk = await asyncio.to_thread(self._next_chunk_or_end)
+                await self.chunks.put(chunk)
+
+                if chunk is self.sentinel:
+                    break
+        except Exception as e:
+            await self.chunks.put(e)
+
+    async def _fetch_next_chunk(self):
+        chunk = await self.chunks.get()
+
+        if isinstance(chunk, Exception):
+            raise chunk
+
+        return chunk
+
+    def _next_chunk_or_end(self):
+        chunk = [
+            Bar(OHLCV.from_list(data), True)
+            for data in islice(self.iterator, self.batch_size)
+        ]
+
+        return chunk if chunk else self.sentinel
 
     def get_last_bar(self):
         return self.last_row
@@ -80,10 +143,12 @@ class HistoricalActor(Actor):
         timeframe: Timeframe,
         exchange: AbstractExchange,
         config_service: AbstractConfig,
+        base_timeframe: Timeframe | None = None,
     ):
         super().__init__(symbol, timeframe)
         self.exchange = exchange
         self.config_service = config_service.get("backtest")
+        self.base_timeframe = base_timeframe
         self.last_bar = None
 
     def pre_receive(self, msg: StartHistoricalFeed):
@@ -99,10 +164,15 @@ class HistoricalActor(Actor):
             msg.in_sample,
             msg.out_sample,
             self.config_service["batch_size"],
+            self.config_service["read_ahead"],
+            self.base_timeframe,
         ) as stream:
-            async for bar in stream:
-                await self.tell(
-                    NewMarketDataReceived(symbol, timeframe, bar.ohlcv, bar.closed)
+            async for bars in stream.batches():
+                await self.tell_many(
+                    [
+                        NewMarketDataReceived(symbol, timeframe, bar.ohlcv, bar.closed)
+                        for bar in bars
+                    ]
                 )
 
             self.last_bar = stream.get_last_bar()
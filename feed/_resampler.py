@@ -0,0 +1,209 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.interfaces.abstract_ws import AbstractWS
+from core.models.bar import Bar
+from core.models.ohlcv import OHLCV
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+from infrastructure.bar_queue import BarQueue
+
+logger = logging.getLogger(__name__)
+
+TIMEFRAME_MS = {
+    Timeframe.ONE_MINUTE: 60_000,
+    Timeframe.THREE_MINUTES: 180_000,
+    Timeframe.FIVE_MINUTES: 300_000,
+    Timeframe.FIFTEEN_MINUTES: 900_000,
+    Timeframe.ONE_HOUR: 3_600_000,
+    Timeframe.FOUR_HOURS: 14_400_000,
+}
+
+
+class Resampler:
+    def __init__(self, timeframe: Timeframe, base: Timeframe = Timeframe.ONE_MINUTE):
+        self.period = TIMEFRAME_MS[timeframe]
+        self.base_period = TIMEFRAME_MS[base]
+
+        if self.period % self.base_period:
+            raise ValueError(f"Cannot resample {base} into {timeframe}")
+
+        self._start = None
+        self._bar = None
+        self._complete = False
+        self._committed = None
+
+    def update(self, ohlcv: OHLCV, closed: bool) -> List[Bar]:
+        base_start = ohlcv.timestamp - ohlcv.timestamp % self.base_period
+        start = base_start - base_start % self.period
+        bars = []
+
+        if self._committed is not None and base_start <= self._committed:
+            return bars
+
+        if self._start is not None and start != self._start:
+            if start < self._start:
+                return bars
+
+            if self._bar is not None and self._complete:
+                bars.append(Bar(self._bar, True))
+
+            self._start = None
+
+        if self._start is None:
+            self._start = start
+            self._bar = None
+            self._complete = base_start == start
+
+        merged = self._merge(ohlcv)
+
+        if not closed:
+            bars.append(Bar(merged, False))
+            return bars
+
+        self._bar = merged
+        self._committed = base_start
+
+        if base_start + self.base_period < start + self.period:
+            bars.append(Bar(merged, False))
+            return bars
+
+        if self._complete:
+            bars.append(Bar(merged, True))
+
+        self._start = None
+        self._bar = None
+
+        return bars
+
+    def _merge(self, ohlcv: OHLCV) -> OHLCV:
+        bar = self._bar
+
+        if bar is None:
+            return OHLCV(
+                self._start,
+                ohlcv.open,
+                ohlcv.high,
+                ohlcv.low,
+                ohlcv.close,
+                ohlcv.volume,
+            )
+
+        return OHLCV(
+            self._start,
+            bar.open,
+            max(bar.high, ohlcv.high),
+            min(bar.low, ohlcv.low),
+            ohlcv.close,
+            bar.volume + ohlcv.volume,
+        )
+
+
+def resample(
+    rows: Iterable, timeframe: Timeframe, base: Timeframe = Timeframe.ONE_MINUTE
+) -> Iterator[List]:
+    resampler = Resampler(timeframe, base)
+
+    for row in rows:
+        for bar in resampler.update(OHLCV.from_list(row), True):
+            if bar.closed:
+                ohlcv = bar.ohlcv
+                yield [
+                    ohlcv.timestamp,
+                    ohlcv.open,
+                    ohlcv.high,
+                    ohlcv.low,
+                    ohlcv.close,
+                    ohlcv.volume,
+                ]
+
+
+class ResamplingWS(AbstractWS):
+    def __init__(self, ws: AbstractWS, base: Timeframe, queue_size: int):
+        self.ws = ws
+        self.base = base
+        self.queue_size = queue_size
+
+        self._resamplers: Dict[Symbol, Dict[Timeframe, Resampler]] = {}
+        self._queues: Dict[Tuple[Symbol, Timeframe], BarQueue] = {}
+        self._pumps: Dict[Symbol, asyncio.Task] = {}
+        self._lock = asyncio.Lock()
+
+    async def run(self):
+        await self.ws.run()
+
+    async def receive(self, symbol: Symbol, timeframe: Timeframe) -> Optional[Bar]:
+        item = await self._get_queue((symbol, timeframe)).get()
+
+        if isinstance(item, Exception):
+            raise item
+
+        return item
+
+    async def subscribe(self, symbol: Symbol, timeframe: Timeframe):
+        async with self._lock:
+            resamplers = self._resamplers.setdefault(symbol, {})
+
+            if timeframe in resamplers:
+                return
+
+            resamplers[timeframe] = Resampler(timeframe, self.base)
+            self._get_queue((symbol, timeframe))
+
+            if symbol not in self._pumps:
+                await self.ws.subscribe(symbol, self.base)
+                self._pumps[symbol] = asyncio.create_task(self._pump(symbol))
+
+    async def unsubscribe(self, symbol: Symbol, timeframe: Timeframe):
+        async with self._lock:
+            resamplers = self._resamplers.get(symbol, {})
+
+            if timeframe not in resamplers:
+                return
+
+            del resamplers[timeframe]
+
+            queue = self._queues.pop((symbol, timeframe), None)
+
+            if queue is not None:
+                queue.put_nowait(StopAsyncIteration())
+
+            if resamplers:
+                return
+
+            del self._resamplers[symbol]
+
+            pump = self._pumps.pop(symbol, None)
+
+            if pump:
+                pump.cancel()
+
+            await self.ws.unsubscribe(symbol, self.base)
+
+    async def _pump(self, symbol: Symbol):
+        while True:
+            try:
+                bar = await self.ws.receive(symbol, self.base)
+            except Exception as e:
+                logger.error(f"Base feed {symbol.name}_{self.base} stopped: {e}")
+
+                for timeframe in self._resamplers.get(symbol, {}):
+                    self._get_queue((symbol, timeframe)).put_nowait(e)
+
+                return
+
+            if not bar:
+                continue
+
+            for timeframe, resampler in list(self._resamplers.get(symbol, {}).items()):
+                queue = self._get_queue((symbol, timeframe))
+
+                for resampled in resampler.update(bar.ohlcv, bar.closed):
+                    queue.put_nowait(resampled)
+
+    def _get_queue(self, key: Tuple[Symbol, Timeframe]) -> BarQueue:
+        if key not in self._queues:
+            self._queues[key] = BarQueue(self.queue_size)
+
+        return self._queues[key]
@@ -0,0 +1,61 @@
+import asyncio
+from collections import deque
+from typing import Deque, Union
+
+from core.models.bar import Bar
+
+Item = Union[Bar, Exception]
+
+
+class BarQueue:
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self.dropped = 0
+
+        self._items: Deque[Item] = deque()
+        self._ready = asyncio.Event()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    def put_nowait(self, item: Item) -> None:
+        if self.full():
+            if self._is_tick(item) and self._is_tick(self._items[-1]):
+                self._items[-1] = item
+                self.dropped += 1
+                return
+
+            self._evict_tick()
+
+        self._items.append(item)
+        self._ready.set()
+
+    async def get(self) -> Item:
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+
+        return self._items.popleft()
+
+    def get_nowait(self) -> Item:
+        if not self._items:
+            raise asyncio.QueueEmpty
+
+        return self._items.popleft()
+
+    def _evict_tick(self) -> None:
+        for idx, item in enumerate(self._items):
+            if self._is_tick(item):
+                del self._items[idx]
+                self.dropped += 1
+                return
+
+    @staticmethod
+    def _is_tick(item: Item) -> bool:
+        return isinstance(item, Bar) and not item.closed
@@ -0,0 +1,42 @@
+from typing import Dict, FrozenSet, Hashable, Optional, Tuple
+
+from core.events.base import Event
+
+
+class AppliedEvents:
+    def __init__(self):
+        self.timestamp: Optional[float] = None
+
+        self._pending: Dict[Hashable, float] = {}
+        self._applied: Dict[Hashable, float] = {}
+
+    def track(self, event: Event) -> None:
+        self._pending[event.meta.id] = event.meta.timestamp
+
+    def done(self, event: Event) -> None:
+        timestamp = self._pending.pop(event.meta.id, None)
+
+        if timestamp is None:
+            return
+
+        self._applied[event.meta.id] = timestamp
+        self._advance()
+
+    def restored(self, event: Event) -> None:
+        if self.timestamp is None or event.meta.timestamp > self.timestamp:
+            self.timestamp = event.meta.timestamp
+
+    def watermark(self) -> Tuple[Optional[float], FrozenSet[Hashable]]:
+        return self.timestamp, frozenset(self._applied)
+
+    def _advance(self) -> None:
+        low = min(self._pending.values(), default=None)
+        applied = {}
+
+        for key, timestamp in self._applied.items():
+            if low is not None and timestamp >= low:
+                applied[key] = timestamp
+            elif self.timestamp is None or timestamp > self.timestamp:
+                self.timestamp = timestamp
+
+        self._applied = applied
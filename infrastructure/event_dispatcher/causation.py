@@ -0,0 +1,33 @@
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from core.events.base import Event
+
+Item = Tuple[Event, Tuple[Any], Dict[str, Any]]
+
+
+class Causation:
+    def __init__(self):
+        self.events: Deque[Item] = deque()
+        self.pending = 0
+        self.progress = asyncio.Event()
+
+    def caused(self, event: Event, args: Tuple[Any], kwargs: Dict[str, Any]) -> None:
+        self.events.append((event, args, kwargs))
+        self.progress.set()
+
+    def start(self) -> None:
+        self.pending += 1
+
+    def done(self) -> None:
+        self.pending -= 1
+        self.progress.set()
+
+    @property
+    def settled(self) -> bool:
+        return not self.events and not self.pending
+
+
+causation: ContextVar[Optional[Causation]] = ContextVar("causation", default=None)
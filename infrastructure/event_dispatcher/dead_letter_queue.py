@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import os
+import pickle
+import time
+import traceback
+from collections import deque
+from typing import Awaitable, Callable, Deque, Iterator, List, Optional, Union
+
+from core.events.base import Event
+from core.events.system import DeadLetter
+from core.queries.base import Query
+from infrastructure.event_store.event_store import DLQ_GROUP, PICKLE_CODEC, EventStore
+
+logger = logging.getLogger(__name__)
+
+OFFSET_FILE = "replayed.offset"
+
+Retry = Callable[[Event, str], Awaitable[bool]]
+
+
+class DeadLetterQueue:
+    def __init__(self, store: EventStore, config: dict):
+        self.store = store
+        self.batch_size = config.get("batch_size", 50)
+        self.rate = config.get("rate", 100)
+
+        self.spilled = 0
+        self.replayed = 0
+        self.skipped = 0
+
+        self._recent: Deque[DeadLetter] = deque(maxlen=config.get("size", 100))
+        self._offset_path = os.path.join(store.base_dir, DLQ_GROUP, OFFSET_FILE)
+        self._offset = self._load_offset()
+        self._task = None
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def __iter__(self) -> Iterator[DeadLetter]:
+        return iter(self._recent)
+
+    @property
+    def offset(self) -> Optional[float]:
+        return self._offset
+
+    @property
+    def replaying(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def append(
+        self, handler: str, event: Union[Event, List[Event]], exception: Exception
+    ) -> None:
+        events = event if isinstance(event, list) else [event]
+        trace = "".join(traceback.format_exception(exception))
+
+        letters = [
+            DeadLetter(
+                event, handler, exception.__class__.__name__, str(exception), trace
+            )
+            for event in events
+        ]
+
+        self._recent.extend(letters)
+        await self.store.append_many(letters)
+        self.spilled += len(letters)
+
+    def inspect(
+        self,
+        since: Optional[float] = None,
+        limit: Optional[int] = None,
+        pending: bool = True,
+    ) -> List[DeadLetter]:
+        start = since
+
+        if pending and self._offset is not None:
+            start = self._offset if start is None else max(start, self._offset)
+
+        letters = []
+
+        for timestamp, codec, payload in self.store.records(
+            DLQ_GROUP, start, archived=True
+        ):
+            if codec != PICKLE_CODEC or (start is not None and timestamp <= start):
+                continue
+
+            letters.append(pickle.loads(payload))
+
+            if limit and len(letters) >= limit:
+                break
+
+        return letters
+
+    def schedule(
+        self,
+        retry: Retry,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        rate: Optional[float] = None,
+    ) -> bool:
+        if self.replaying:
+            return False
+
+        self._task = asyncio.create_task(self.replay(retry, limit, batch_size, rate))
+
+        return True
+
+    async def replay(
+        self,
+        retry: Retry,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        rate: Optional[float] = None,
+    ) -> int:
+        batch_size = batch_size or self.batch_size
+        rate = rate or self.rate
+
+        await self.store.flush()
+
+        letters = await asyncio.to_thread(self.inspect, None, limit)
+        count = 0
+
+        for idx in range(0, len(letters), batch_size):
+            batch = letters[idx : idx + batch_size]
+            start = time.monotonic()
+
+            for letter in batch:
+                event = letter.event
+
+                if (
+                    isinstance(event, Event)
+                    and not isinstance(event, Query)
+                    and await retry(event, letter.handler)
+                ):
+                    count += 1
+                else:
+                    self.skipped += 1
+                    logger.warning(
+                        f"Skipped dead letter {type(event).__name__} "
+                        f"for {letter.handler}"
+                    )
+
+            self._save_offset(batch[-1].meta.timestamp)
+
+            delay = len(batch) / rate - (time.monotonic() - start)
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        self.replayed += count
+
+        logger.info(f"Replayed {count} of {len(letters)} dead letters")
+
+        return count
+
+    def stats(self) -> dict:
+        return {
+            "recent": len(self._recent),
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "skipped": self.skipped,
+            "unpicklable": self.store.unpicklable,
+            "offset": self._offset,
+            "replaying": self.replaying,
+        }
+
+    def _load_offset(self) -> Optional[float]:
+        if not os.path.exists(self._offset_path):
+            return None
+
+        with open(self._offset_path) as f:
+            return float(f.read())
+
+    def _save_offset(self, timestamp: float) -> None:
+        dir_path = os.path.dirname(self._offset_path)
+
+        if not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        tmp_path = f"{self._offset_path}.tmp"
+
+        with open(tmp_path, "w") as f:
+            f.write(repr(timestamp))
+
+        os.replace(tmp_path, self._offset_path)
+
+        self._offset = timestamp
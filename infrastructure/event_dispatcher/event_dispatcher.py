@@ -1,15 +1,43 @@
 import asyncio
-from typing import Any, Callable, Optional, Type
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from core.commands.base import Command
+from core.commands.system import ReplayDeadLetters
 from core.events.base import Event, EventEnded
 from core.interfaces.abstract_config import AbstractConfig
+from core.interfaces.abstract_scheduler import AbstractScheduler
+from core.models.backpressure import BackpressurePolicy
+from core.models.execution import ExecutionPolicy
+from core.models.scheduler import SchedulerType
 from core.queries.base import Query
+from core.queries.system import GetBusMetrics, GetDeadLetters
 from infrastructure.event_store.event_store import EventStore
+from infrastructure.telemetry.bus_metrics import BusMetrics
 
+from .applied_events import AppliedEvents
+from .causation import Causation, causation
+from .dead_letter_queue import DeadLetterQueue
 from .event_handler import EventHandler
+from .event_queue import awaiting
+from .handler_executor import DEFAULT_POOL, HandlerExecutor
+from .load_balancer import LoadBalancer
+from .weighted_round_robin import WeightedRoundRobin
 from .worker_pool import WorkerPool
 
+replaying: ContextVar[bool] = ContextVar("replaying", default=False)
+
 
 class SingletonMeta(type):
     _instance = None
@@ -21,12 +49,38 @@ class SingletonMeta(type):
 
 
 class EventDispatcher(metaclass=SingletonMeta):
+    _scheduler_type = {
+        SchedulerType.PID: LoadBalancer,
+        SchedulerType.WRR: WeightedRoundRobin,
+    }
+
     def __init__(self, config_service: AbstractConfig):
-        self.event_handler = EventHandler()
+        self._store = EventStore(config_service)
+        self.metrics = BusMetrics()
+        self.dead_letters = DeadLetterQueue(
+            self._store, config_service.get("dlq") or {}
+        )
+        self.event_handler = EventHandler(
+            HandlerExecutor(config_service.get("executor")),
+            self.metrics,
+            self.dead_letters,
+        )
+        self.event_handler.register(
+            GetBusMetrics, self._get_bus_metrics, policy=ExecutionPolicy.INLINE
+        )
+        self.event_handler.register(GetDeadLetters, self._get_dead_letters)
+        self.event_handler.register(
+            ReplayDeadLetters,
+            self._replay_dead_letters,
+            policy=ExecutionPolicy.INLINE,
+        )
         self.cancel_event = asyncio.Event()
 
         self.config = config_service.get("bus")
-        self._store = EventStore(config_service)
+        self.backpressure = config_service.get("backpressure")
+        self.applied = AppliedEvents()
+        self._in_flight: Dict[Hashable, Command] = {}
+        self._causes: Dict[Hashable, Causation] = {}
 
         self._command_worker_pool = None
         self._query_worker_pool = None
@@ -35,19 +89,19 @@ class EventDispatcher(metaclass=SingletonMeta):
     @property
     def command_worker_pool(self):
         if self._command_worker_pool is None:
-            self._command_worker_pool = self._create_worker_pool()
+            self._command_worker_pool = self._create_worker_pool("command")
         return self._command_worker_pool
 
     @property
     def query_worker_pool(self):
         if self._query_worker_pool is None:
-            self._query_worker_pool = self._create_worker_pool()
+            self._query_worker_pool = self._create_worker_pool("query")
         return self._query_worker_pool
 
     @property
     def event_worker_pool(self):
         if self._event_worker_pool is None:
-            self._event_worker_pool = self._create_worker_pool()
+            self._event_worker_pool = self._create_worker_pool("event")
         return self._event_worker_pool
 
     def register(
@@ -55,19 +109,71 @@ class EventDispatcher(metaclass=SingletonMeta):
         event_class: Type[Event],
         handler: Callable,
         filter_func: Optional[Callable[[Event], bool]] = None,
+        routing_key: Optional[Hashable] = None,
+        batch: bool = False,
+        policy: ExecutionPolicy = ExecutionPolicy.THREAD,
+        pool: str = DEFAULT_POOL,
     ) -> None:
-        self.event_handler.register(event_class, handler, filter_func)
+        self.event_handler.register(
+            event_class, handler, filter_func, routing_key, batch, policy, pool
+        )
 
     def unregister(self, event_class: Type[Event], handler: Callable) -> None:
         self.event_handler.unregister(event_class, handler)
 
+    @property
+    def replaying(self) -> bool:
+        return replaying.get()
+
     async def execute(self, command: Command, *args, **kwargs) -> None:
+        if replaying.get():
+            return
+
+        with awaiting():
+            await self._execute(command, *args, **kwargs)
+
+    async def _execute(self, command: Command, *args, **kwargs) -> None:
+        if command._idempotent:
+            await self._execute_once(command, *args, **kwargs)
+            return
+
+        entry = self.event_handler.resolve_direct(command)
+
+        if entry is not None:
+            await self.event_handler.invoke(entry, command, *args, **kwargs)
+            return
+
         await asyncio.gather(
             self._dispatch_to_poll(command, self.command_worker_pool, *args, **kwargs),
             command.wait_for_execution(),
         )
 
+    async def _execute_once(self, command: Command, *args, **kwargs) -> None:
+        key = command.meta.key
+        original = self._in_flight.get(key)
+
+        if original is None:
+            self._in_flight[key] = command
+
+            try:
+                if await self._dispatch_to_poll(
+                    command, self.command_worker_pool, *args, **kwargs
+                ):
+                    await command.wait_for_execution()
+            finally:
+                del self._in_flight[key]
+        else:
+            await original.wait_for_execution()
+
+        command.executed()
+
     async def query(self, query: Query, *args, **kwargs) -> Any:
+        entry = self.event_handler.resolve_direct(query)
+
+        if entry is not None:
+            await self.event_handler.invoke(entry, query, *args, **kwargs)
+            return await query.wait_for_response()
+
         _, result = await asyncio.gather(
             self._dispatch_to_poll(query, self.query_worker_pool, *args, **kwargs),
             query.wait_for_response(),
@@ -76,8 +182,55 @@ class EventDispatcher(metaclass=SingletonMeta):
         return result
 
     async def dispatch(self, event: Event, *args, **kwargs) -> None:
-        await self._dispatch_to_poll(event, self.event_worker_pool, *args, **kwargs)
-        self._store.append(event)
+        if replaying.get():
+            return
+
+        self._track(event)
+
+        cause = causation.get()
+
+        if cause is not None:
+            cause.caused(event, args, kwargs)
+        else:
+            await self._dispatch_to_poll(event, self.event_worker_pool, *args, **kwargs)
+
+        await self._store.append(event)
+
+    async def dispatch_many(self, events: List[Event], *args, **kwargs) -> None:
+        if not events or replaying.get():
+            return
+
+        for event in events:
+            self._track(event)
+
+        cause = causation.get()
+
+        if cause is not None:
+            for event in events:
+                cause.caused(event, args, kwargs)
+        else:
+            await self.event_worker_pool.dispatch_batch_to_worker(
+                events, *args, **kwargs
+            )
+
+        await self._store.append_many(events)
+
+    async def replay(self, events: Iterable[Event]) -> int:
+        token = replaying.set(True)
+        count = 0
+
+        try:
+            for event in events:
+                await self.event_handler.handle_event(event)
+                self.applied.restored(event)
+                count += 1
+        finally:
+            replaying.reset(token)
+
+        return count
+
+    def watermark(self) -> Tuple[Optional[float], FrozenSet[Hashable]]:
+        return self.applied.watermark()
 
     async def wait(self) -> None:
         await asyncio.gather(
@@ -96,21 +249,105 @@ class EventDispatcher(metaclass=SingletonMeta):
                 self._dispatch_to_poll(EventEnded(), self.command_worker_pool),
             ]
         )
-        self._store.close()
+        await asyncio.to_thread(self._store.close)
+        self.event_handler.executor.shutdown()
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        return self.event_handler.executor.stats()
+
+    def snapshot(self) -> dict:
+        return {
+            "bus": self.metrics.snapshot(),
+            "queues": self.queue_stats(),
+            "pools": self.pool_stats(),
+            "dlq": self.dead_letters.stats(),
+            "store": self._store.stats(),
+        }
+
+    def queue_stats(self) -> Dict[str, List[dict]]:
+        pools = {
+            "command": self._command_worker_pool,
+            "query": self._query_worker_pool,
+            "event": self._event_worker_pool,
+        }
+
+        return {
+            name: pool.queue_stats() for name, pool in pools.items() if pool is not None
+        }
+
+    def _get_bus_metrics(self, _query: GetBusMetrics) -> dict:
+        return self.snapshot()
+
+    async def _get_dead_letters(self, query: GetDeadLetters) -> list:
+        await self._store.flush()
+
+        return await asyncio.to_thread(
+            self.dead_letters.inspect, query.since, query.limit, query.pending
+        )
+
+    def _replay_dead_letters(self, command: ReplayDeadLetters) -> None:
+        self.dead_letters.schedule(
+            self.event_handler.retry, command.limit, command.batch_size, command.rate
+        )
 
     async def _dispatch_to_poll(
         self, event: Type[Event], worker_pool: WorkerPool, *args, **kwargs
-    ) -> None:
+    ) -> bool:
         if isinstance(event, EventEnded):
             self.cancel_event.set()
-            return
+            return False
+
+        cause = causation.get()
+
+        if cause is None:
+            return await worker_pool.dispatch_to_worker(event, *args, **kwargs)
+
+        cause.start()
+        self._causes[event.meta.key] = cause
+
+        queued = False
 
-        await worker_pool.dispatch_to_worker(event, *args, **kwargs)
+        try:
+            queued = await worker_pool.dispatch_to_worker(event, *args, **kwargs)
+        finally:
+            if not queued and self._causes.pop(event.meta.key, None) is cause:
+                cause.done()
 
-    def _create_worker_pool(self) -> WorkerPool:
+        return queued
+
+    def _track(self, event: Event) -> None:
+        if event.__class__.__name__ in self._store.replay_events:
+            self.applied.track(event)
+
+    def _create_worker_pool(self, name: str) -> WorkerPool:
         return WorkerPool(
             self.config["num_workers"],
-            self.config["piority_groups"],
+            self._create_scheduler(),
             self.event_handler,
             self.cancel_event,
+            self.backpressure[f"{name}_queue_size"],
+            self._create_policies(),
+            name,
+            self.metrics,
+            bool(self.config.get("coalesce", 0)),
+            self.config.get("aging", 0.0),
+            self.applied.done,
+            self._causes,
         )
+
+    def _create_policies(self) -> Dict[str, BackpressurePolicy]:
+        return {
+            group: BackpressurePolicy(policy)
+            for group, policy in self.backpressure.items()
+            if not group.endswith("_queue_size")
+        }
+
+    def _create_scheduler(self) -> AbstractScheduler:
+        type = SchedulerType(self.config.get("scheduler", SchedulerType.PID.value))
+
+        if type not in self._scheduler_type:
+            raise ValueError(f"Unknown Scheduler: {type}")
+
+        scheduler = self._scheduler_type.get(type)
+
+        return scheduler(self.config["piority_groups"])
@@ -1,77 +1,265 @@
 import asyncio
+import inspect
 import logging
-from collections import defaultdict, deque
+import time
+from collections import defaultdict
 from functools import partial
-from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from core.commands.base import Command
 from core.events.base import Event
+from core.models.execution import ExecutionPolicy
 from core.queries.base import Query
+from infrastructure.telemetry.bus_metrics import BusMetrics
+
+from .causation import Causation, causation
+from .dead_letter_queue import DeadLetterQueue
+from .handler_executor import DEFAULT_POOL, HandlerExecutor
 
 HandlerType = Union[partial, Callable[..., Any]]
+FilterType = Optional[Callable[[Event], bool]]
+RoutingKey = Optional[Hashable]
+
+
+class HandlerEntry(NamedTuple):
+    handler: HandlerType
+    filter_fn: FilterType
+    batch: bool
+    policy: ExecutionPolicy
+    pool: str
+    name: str
 
 
 logger = logging.getLogger(__name__)
 
 
 class EventHandler:
-    def __init__(self):
-        self._event_handlers: Dict[Type[Event], List[HandlerType]] = defaultdict(list)
-        self._dead_letter_queue: Deque[Tuple[Event, Exception]] = deque(maxlen=100)
+    def __init__(
+        self,
+        executor: HandlerExecutor,
+        metrics: BusMetrics,
+        dead_letters: DeadLetterQueue,
+    ):
+        self._executor = executor
+        self._metrics = metrics
+        self._event_handlers: Dict[Type[Event], List[HandlerEntry]] = defaultdict(list)
+        self._routed_handlers: Dict[
+            Tuple[Type[Event], Hashable], List[HandlerEntry]
+        ] = defaultdict(list)
+        self._routed_event_types: Dict[Type[Event], int] = defaultdict(int)
+        self._dead_letter_queue = dead_letters
 
     @property
     def dlq(self):
         return self._dead_letter_queue
 
+    @property
+    def executor(self):
+        return self._executor
+
     def register(
         self,
         event_class: Type[Event],
         handler: HandlerType,
-        filter_func: Optional[Callable[[Event], bool]] = None,
+        filter_func: FilterType = None,
+        routing_key: RoutingKey = None,
+        batch: bool = False,
+        policy: ExecutionPolicy = ExecutionPolicy.THREAD,
+        pool: str = DEFAULT_POOL,
     ) -> None:
-        self._event_handlers[event_class].append((handler, filter_func))
+        if asyncio.iscoroutinefunction(handler):
+            policy = ExecutionPolicy.INLINE
+
+        if policy == ExecutionPolicy.PROCESS and not self._is_module_function(handler):
+            raise ValueError(f"Unpicklable Handler: {self._get_handler_name(handler)}")
+
+        entry = HandlerEntry(
+            handler, filter_func, batch, policy, pool, self._get_handler_name(handler)
+        )
+
+        if routing_key is None:
+            self._event_handlers[event_class].append(entry)
+            return
+
+        self._routed_handlers[(event_class, routing_key)].append(entry)
+        self._routed_event_types[event_class] += 1
 
     def unregister(self, event_class: Type[Event], handler: HandlerType) -> None:
         self._event_handlers[event_class] = [
-            (h, filter_fn)
-            for h, filter_fn in self._event_handlers.get(event_class, [])
-            if h != handler
+            entry
+            for entry in self._event_handlers.get(event_class, [])
+            if entry.handler != handler
         ]
 
+        if not self._routed_event_types.get(event_class):
+            return
+
+        for key in [key for key in self._routed_handlers if key[0] == event_class]:
+            handlers = self._routed_handlers[key]
+            remaining = [entry for entry in handlers if entry.handler != handler]
+
+            self._routed_event_types[event_class] -= len(handlers) - len(remaining)
+
+            if remaining:
+                self._routed_handlers[key] = remaining
+            else:
+                del self._routed_handlers[key]
+
     async def handle_event(self, event: Event, *args, **kwargs) -> None:
+        for entry in self._resolve_handlers(event):
+            if not entry.filter_fn or entry.filter_fn(event):
+                await self._call_handler(
+                    entry, [event] if entry.batch else event, *args, **kwargs
+                )
+
+    async def handle_batch(
+        self,
+        events: List[Event],
+        *args,
+        settle: Optional[Callable[[Causation], Awaitable[None]]] = None,
+        **kwargs,
+    ) -> None:
+        blocks: Dict[HandlerEntry, List[Event]] = {}
+
+        for event in events:
+            cause = Causation() if settle else None
+            token = causation.set(cause)
+
+            try:
+                for entry in self._resolve_handlers(event):
+                    if entry.filter_fn and not entry.filter_fn(event):
+                        continue
+
+                    if entry.batch:
+                        blocks.setdefault(entry, []).append(event)
+                    else:
+                        await self._call_handler(entry, event, *args, **kwargs)
+
+                if settle:
+                    await settle(cause)
+            finally:
+                causation.reset(token)
+
+        for entry, block in blocks.items():
+            await self._call_handler(entry, block, *args, **kwargs)
+
+    async def retry(self, event: Event, handler_name: str, *args, **kwargs) -> bool:
+        entries = [
+            entry
+            for entry in self._resolve_handlers(event)
+            if entry.name == handler_name
+        ]
+
+        for entry in entries:
+            await self._call_handler(
+                entry, [event] if entry.batch else event, *args, **kwargs
+            )
+
+        return bool(entries)
+
+    def resolve_direct(self, event: Event) -> Optional[HandlerEntry]:
+        handlers = self._resolve_handlers(event)
+
+        if len(handlers) != 1:
+            return None
+
+        entry = handlers[0]
+
+        if entry.batch or (entry.filter_fn and not entry.filter_fn(event)):
+            return None
+
+        return entry
+
+    async def invoke(self, entry: HandlerEntry, event: Event, *args, **kwargs) -> None:
+        await self._call_handler(entry, event, *args, **kwargs)
+
+    def _resolve_handlers(self, event: Event) -> List[HandlerEntry]:
         event_type = type(event)
         handlers = self._event_handlers.get(event_type, [])
 
-        for handler, filter_fn in handlers:
-            if not filter_fn or filter_fn(event):
-                await self._call_handler(handler, event, *args, **kwargs)
+        if not self._routed_event_types.get(event_type):
+            return handlers
+
+        routing_key = event.routing_key
+
+        if routing_key is None:
+            return handlers
+
+        routed_handlers = self._routed_handlers.get((event_type, routing_key))
+
+        if not routed_handlers:
+            return handlers
+
+        return routed_handlers + handlers if handlers else routed_handlers
 
     async def _call_handler(
-        self, handler: HandlerType, event: Event, *args, **kwargs
+        self, entry: HandlerEntry, event: Event, *args, **kwargs
     ) -> None:
+        event_type = type(event[0] if isinstance(event, list) else event).__name__
+        start = time.perf_counter()
+
         try:
-            await self._execute_handler(handler, event, *args, **kwargs)
+            await self._execute_handler(entry, event, *args, **kwargs)
         except Exception as e:
-            self._handle_exception(handler, event, e)
+            self._metrics.record_failure(
+                entry.name, event_type, len(event) if isinstance(event, list) else 1
+            )
+            await self._handle_exception(entry, event, e)
+        finally:
+            self._metrics.record_execution(
+                entry.name, event_type, time.perf_counter() - start
+            )
 
     async def _execute_handler(
-        self, handler: HandlerType, event: Event, *args, **kwargs
+        self, entry: HandlerEntry, event: Event, *args, **kwargs
     ) -> None:
+        handler = entry.handler
+
         if asyncio.iscoroutinefunction(handler):
             response = await handler(event, *args, **kwargs)
         else:
-            response = await asyncio.to_thread(handler, event, *args, **kwargs)
+            response = await self._executor.run(
+                entry.policy, entry.pool, handler, event, *args, **kwargs
+            )
 
         if isinstance(event, Query):
             event.set_response(response)
         elif isinstance(event, Command):
             event.executed()
 
-    def _handle_exception(
-        self, handler: HandlerType, event: Event, exception: Exception
+    @staticmethod
+    def _is_module_function(handler: HandlerType) -> bool:
+        func = handler.func if isinstance(handler, partial) else handler
+
+        return inspect.isfunction(func) and func.__qualname__ == func.__name__
+
+    @staticmethod
+    def _get_handler_name(handler: HandlerType) -> str:
+        func = handler.func if isinstance(handler, partial) else handler
+        owner = getattr(func, "__self__", None)
+
+        if owner is not None:
+            return f"{owner.__class__.__name__}.{func.__name__}"
+
+        return getattr(func, "__qualname__", repr(func))
+
+    async def _handle_exception(
+        self, entry: HandlerEntry, event: Event, exception: Exception
     ) -> None:
         logger.error(
-            f"Exception encountered in event {event}:{handler} {exception}. Event added to dead letter queue."
+            f"Exception encountered in event {event}:{entry.handler} {exception}. Event added to dead letter queue."
         )
 
         if isinstance(event, Command):
@@ -79,4 +267,4 @@ class EventHandler:
         elif isinstance(event, Query):
             event.set_response(None)
 
-        self._dead_letter_queue.append((event, exception))
+        await self._dead_letter_queue.append(entry.name, event, exception)
@@ -0,0 +1,226 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from core.commands.base import Command
+from core.models.backpressure import BackpressurePolicy
+from core.queries.base import Query
+from infrastructure.telemetry.bus_metrics import BusMetrics
+from infrastructure.telemetry.queue_monitor import QueueMonitor
+
+queue_owner: ContextVar[Any] = ContextVar("queue_owner", default=None)
+worker_queue: ContextVar[Optional["EventQueue"]] = ContextVar(
+    "worker_queue", default=None
+)
+
+
+@contextmanager
+def awaiting() -> Iterator[None]:
+    queue = worker_queue.get()
+
+    if queue is None:
+        yield
+        return
+
+    with queue.awaiting():
+        yield
+
+
+class EventQueue(asyncio.Queue):
+    def __init__(
+        self,
+        maxsize: int,
+        policies: Dict[str, BackpressurePolicy],
+        owner: Any,
+        on_discard: Callable[[Any], None],
+        monitor: QueueMonitor,
+        metrics: BusMetrics,
+        coalesce: bool = False,
+        aging: float = 0.0,
+    ):
+        self._metrics = metrics
+        self._aging = aging
+        self._coalesce_pending = coalesce
+        self._policies = policies
+        self._owner = owner
+        self._on_discard = on_discard
+        self._monitor = monitor
+        self._capacity = maxsize
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._awaited = 0
+        super().__init__()
+
+    def _init(self, maxsize: int):
+        self._groups: Dict[str, Deque[List[Any]]] = {}
+        self._pending: Dict[Any, List[Any]] = {}
+        self._seq = count()
+        self._size = 0
+
+    def _put(self, item):
+        event = self._head(item)
+        group = str(event.meta.group)
+        slot = [next(self._seq), time.monotonic(), item, event.meta.priority]
+
+        if group not in self._groups:
+            self._groups[group] = deque()
+
+        self._groups[group].append(slot)
+        self._size += 1
+
+        coalesce_key = self._coalesce_key(item)
+
+        if coalesce_key is not None:
+            self._pending[coalesce_key] = slot
+        elif self._pending:
+            self._fence(item)
+
+        self._monitor.event_enqueued(self._size)
+
+    def _get(self):
+        now = time.monotonic()
+        group = min(self._groups, key=lambda name: self._rank(name, now))
+
+        if len(self._groups) > 1 and self._groups[group][0][3] > min(
+            slots[0][3] for slots in self._groups.values()
+        ):
+            self._monitor.event_promoted()
+
+        slot = self._remove_slot(group)
+
+        lag = now - slot[1]
+        event = slot[2][0]
+
+        self._monitor.event_dequeued(self._size, lag)
+
+        if isinstance(event, list):
+            self._metrics.record_wait(type(event[0]).__name__, lag, len(event))
+        else:
+            self._metrics.record_wait(type(event).__name__, lag)
+
+        return slot[2]
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    async def put(self, item):
+        if self._coalesce_pending and self._coalesce(item):
+            return
+
+        if self._blocks() and queue_owner.get() is not self._owner:
+            policy = self._get_policy(item)
+
+            if policy == BackpressurePolicy.COALESCE and self._coalesce(item):
+                return
+
+            if policy == BackpressurePolicy.DROP_OLDEST:
+                self._drop_oldest(str(self._head(item).meta.group))
+
+            while self._blocks():
+                self._not_full.clear()
+                await self._not_full.wait()
+
+        self.put_nowait(item)
+
+    @contextmanager
+    def awaiting(self) -> Iterator[None]:
+        self._awaited += 1
+        self._not_full.set()
+
+        try:
+            yield
+        finally:
+            self._awaited -= 1
+
+    def snapshot(self) -> dict:
+        return self._monitor.snapshot()
+
+    def _at_capacity(self) -> bool:
+        return 0 < self._capacity <= self._size
+
+    def _blocks(self) -> bool:
+        return not self._awaited and self._at_capacity()
+
+    def _coalesce(self, item) -> bool:
+        coalesce_key = self._coalesce_key(item)
+
+        if coalesce_key is None or coalesce_key not in self._pending:
+            return False
+
+        slot = self._pending[coalesce_key]
+        replaced = slot[2]
+        slot[2] = item
+
+        self._on_discard(replaced)
+        self._monitor.event_coalesced()
+
+        return True
+
+    def _drop_oldest(self, group: str) -> None:
+        if group not in self._groups:
+            return
+
+        slot = self._remove_slot(group)
+
+        self.task_done()
+        self._on_discard(slot[2])
+        self._monitor.event_dropped(self._size)
+
+    def _fence(self, item) -> None:
+        event = item[0]
+        events = event if isinstance(event, list) else [event]
+
+        for routing_key in {e.routing_key for e in events}:
+            self._pending.pop(routing_key, None)
+
+    def _remove_slot(self, group: str) -> List[Any]:
+        slots = self._groups[group]
+        slot = slots.popleft()
+
+        if not slots:
+            del self._groups[group]
+
+        self._size -= 1
+
+        if not self._at_capacity():
+            self._not_full.set()
+
+        coalesce_key = self._coalesce_key(slot[2])
+
+        if coalesce_key is not None and self._pending.get(coalesce_key) is slot:
+            del self._pending[coalesce_key]
+
+        return slot
+
+    def _rank(self, group: str, now: float) -> Tuple[float, int]:
+        seq, enqueued_at, _, priority = self._groups[group][0]
+
+        if self._aging:
+            priority -= (now - enqueued_at) / self._aging
+
+        return priority, seq
+
+    def _get_policy(self, item) -> BackpressurePolicy:
+        event = item[0]
+
+        if isinstance(event, (list, Command, Query)):
+            return BackpressurePolicy.BLOCK
+
+        return self._policies.get(str(event.meta.group), BackpressurePolicy.BLOCK)
+
+    @staticmethod
+    def _coalesce_key(item):
+        event = item[0]
+        return None if isinstance(event, list) else event.coalesce_key
+
+    @staticmethod
+    def _head(item):
+        event = item[0]
+        return event[0] if isinstance(event, list) else event
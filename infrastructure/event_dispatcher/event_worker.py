@@ -1,9 +1,14 @@
 import asyncio
-from typing import Any, AsyncIterable, Dict, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from core.events.base import Event
+from core.models.backpressure import BackpressurePolicy
+from infrastructure.telemetry.bus_metrics import BusMetrics
+from infrastructure.telemetry.queue_monitor import QueueMonitor
 
+from .causation import Causation, causation
 from .event_handler import EventHandler
+from .event_queue import EventQueue, queue_owner, worker_queue
 
 
 class EventWorker:
@@ -12,37 +17,130 @@ class EventWorker:
         event_handler: EventHandler,
         cancel_event: asyncio.Event,
         events_in_queue: set,
+        causes: Dict[Any, Causation],
+        worker_tasks: set,
+        queue_size: int,
+        policies: Dict[str, BackpressurePolicy],
+        name: str,
+        coalesce: bool,
+        metrics: BusMetrics,
+        aging: float = 0.0,
+        on_done: Optional[Callable[[Event], None]] = None,
     ):
         self.event_handler = event_handler
         self.cancel_event = cancel_event
+        self.owner = worker_tasks
         self.events_in_queue = events_in_queue
+        self.causes = causes
+        self.on_done = on_done
 
-        self.queue = asyncio.Queue()
+        self.queue = EventQueue(
+            queue_size,
+            policies,
+            worker_tasks,
+            self._discard,
+            QueueMonitor(name, queue_size),
+            metrics,
+            coalesce,
+            aging,
+        )
         self.tasks = asyncio.create_task(self._process_events())
 
+        worker_tasks.add(self.tasks)
+
     async def _process_events(self):
-        async for event, args, kwargs in self._get_event_stream():
-            await self.event_handler.handle_event(event, *args, **kwargs)
+        queue_owner.set(self.owner)
+        worker_queue.set(self.queue)
 
-    async def _get_event_stream(
-        self,
-    ) -> AsyncIterable[Tuple[Event, Tuple[Any], Dict[str, Any]]]:
         while not self.cancel_event.is_set():
-            event, args, kwargs = await self.queue.get()
+            await self._process(await self.queue.get())
+
+    async def _process(
+        self, item: Tuple[Union[Event, List[Event]], Tuple[Any], Dict[str, Any]]
+    ) -> None:
+        event, args, kwargs = item
 
-            yield event, args, kwargs
+        if isinstance(event, list):
+            cause = None
+        else:
+            cause = self.causes.pop(event.meta.key, None)
 
-            self.events_in_queue.remove(event.meta.key)
+        token = causation.set(cause) if cause else None
+
+        try:
+            if isinstance(event, list):
+                await self.event_handler.handle_batch(
+                    event, *args, settle=self._settle, **kwargs
+                )
+            else:
+                await self.event_handler.handle_event(event, *args, **kwargs)
+        finally:
+            if token:
+                causation.reset(token)
+                cause.done()
+
+            self._discard(item)
             self.queue.task_done()
 
-    async def dispatch(self, event: Event, *args, **kwargs) -> None:
+    async def _settle(self, cause: Causation) -> None:
+        while not cause.settled:
+            if not cause.events:
+                cause.progress.clear()
+                await cause.progress.wait()
+                continue
+
+            event, args, kwargs = cause.events.popleft()
+
+            try:
+                await self.event_handler.handle_event(event, *args, **kwargs)
+            finally:
+                if self.on_done:
+                    self.on_done(event)
+
+    async def dispatch(self, event: Event, *args, **kwargs) -> bool:
         event_key = event.meta.key
 
         if event_key in self.events_in_queue:
-            return
+            return False
 
         self.events_in_queue.add(event_key)
         await self.queue.put((event, args, kwargs))
 
+        return True
+
+    async def dispatch_batch(self, events: List[Event], *args, **kwargs) -> None:
+        batch = []
+
+        for event in events:
+            event_key = event.meta.key
+
+            if event_key in self.events_in_queue:
+                continue
+
+            self.events_in_queue.add(event_key)
+            batch.append(event)
+
+        if not batch:
+            return
+
+        await self.queue.put((batch, args, kwargs))
+
     async def wait(self) -> None:
         await self.queue.join()
+
+    def _discard(self, item) -> None:
+        event = item[0]
+
+        if isinstance(event, list):
+            self.events_in_queue.difference_update(e.meta.key for e in event)
+        else:
+            self.events_in_queue.discard(event.meta.key)
+
+            cause = self.causes.pop(event.meta.key, None)
+
+            if cause:
+                cause.done()
+
+        if self.on_done:
+            for done in event if isinstance(event, list) else [event]:
+                self.on_done(done)
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+
+from core.models.execution import ExecutionPolicy
+
+PROCESS_POOL = "process"
+DEFAULT_POOL = "default"
+
+
+class HandlerExecutor:
+    def __init__(self, config: Dict[str, int]):
+        self._sizes = {
+            key[: -len("_workers")]: value
+            for key, value in config.items()
+            if key.endswith("_workers")
+        }
+        self._executors: Dict[str, Executor] = {}
+        self._queued: Dict[str, int] = dict.fromkeys(self._sizes, 0)
+        self._active: Dict[str, int] = dict.fromkeys(self._sizes, 0)
+        self._lock = threading.Lock()
+
+    async def run(
+        self,
+        policy: ExecutionPolicy,
+        pool: str,
+        handler: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> Any:
+        if policy == ExecutionPolicy.INLINE:
+            return handler(*args, **kwargs)
+
+        if policy == ExecutionPolicy.PROCESS:
+            return await self._run_process(handler, *args, **kwargs)
+
+        executor = self._get_executor(pool)
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            self._queued[pool] += 1
+
+        return await loop.run_in_executor(
+            executor, partial(self._track, pool, handler, *args, **kwargs)
+        )
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                name: {
+                    "size": size,
+                    "queued": self._queued[name],
+                    "active": self._active[name],
+                }
+                for name, size in self._sizes.items()
+            }
+
+    def shutdown(self) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self._executors = {}
+
+    async def _run_process(self, handler: Callable[..., Any], *args, **kwargs) -> Any:
+        executor = self._get_executor(PROCESS_POOL)
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            self._queued[PROCESS_POOL] += 1
+            self._balance(PROCESS_POOL)
+
+        try:
+            return await loop.run_in_executor(
+                executor, partial(handler, *args, **kwargs)
+            )
+        finally:
+            with self._lock:
+                self._active[PROCESS_POOL] -= 1
+                self._balance(PROCESS_POOL)
+
+    def _balance(self, pool: str) -> None:
+        started = min(self._queued[pool], self._sizes[pool] - self._active[pool])
+
+        self._queued[pool] -= started
+        self._active[pool] += started
+
+    def _track(self, pool: str, handler: Callable[..., Any], *args, **kwargs) -> Any:
+        self._start(pool)
+
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            self._finish(pool)
+
+    def _start(self, pool: str) -> None:
+        with self._lock:
+            self._queued[pool] -= 1
+            self._active[pool] += 1
+
+    def _finish(self, pool: str) -> None:
+        with self._lock:
+            self._active[pool] -= 1
+
+    def _get_executor(self, pool: str) -> Executor:
+        if pool not in self._sizes:
+            raise ValueError(f"Unknown Pool: {pool}")
+
+        if pool not in self._executors:
+            size = self._sizes[pool]
+
+            self._executors[pool] = (
+                ProcessPoolExecutor(max_workers=size)
+                if pool == PROCESS_POOL
+                else ThreadPoolExecutor(max_workers=size, thread_name_prefix=pool)
+            )
+
+        return self._executors[pool]
@@ -1,12 +1,14 @@
 import numpy as np
 
+from core.interfaces.abstract_scheduler import AbstractScheduler
+
 
 def softmax(x):
     e_x = np.exp(x - np.max(x))
     return e_x / e_x.sum(axis=0)
 
 
-class LoadBalancer:
+class LoadBalancer(AbstractScheduler):
     def __init__(self, priority_groups: int, learning_rate: float = 0.001):
         self._group_event_counts = np.zeros(priority_groups)
         self._initialize_load_balancer(priority_groups)
@@ -0,0 +1,28 @@
+from core.interfaces.abstract_scheduler import AbstractScheduler
+
+
+class WeightedRoundRobin(AbstractScheduler):
+    def __init__(self, priority_groups: int):
+        self._priority_groups = priority_groups
+        self._group_event_counts = [0] * priority_groups
+        self._lanes = [
+            tuple(range(priority - 1, priority_groups, priority))
+            for priority in range(1, priority_groups + 1)
+        ]
+        self._cursors = [0] * priority_groups
+
+    def register_event(self, priority_group: int):
+        if 0 <= priority_group < self._priority_groups:
+            self._group_event_counts[priority_group] += 1
+        else:
+            raise ValueError("Invalid priority group!")
+
+    def determine_priority_group(self, priority: int) -> int:
+        idx = min(max(priority, 1), self._priority_groups) - 1
+
+        lanes = self._lanes[idx]
+        cursor = self._cursors[idx]
+
+        self._cursors[idx] = (cursor + 1) % len(lanes)
+
+        return lanes[cursor]
@@ -1,37 +1,79 @@
 import asyncio
+from typing import Callable, Dict, Hashable, List, Optional
 
 from core.events.base import Event
+from core.interfaces.abstract_scheduler import AbstractScheduler
+from core.models.backpressure import BackpressurePolicy
+from infrastructure.telemetry.bus_metrics import BusMetrics
 
+from .causation import Causation
 from .event_handler import EventHandler
 from .event_worker import EventWorker
-from .load_balancer import LoadBalancer
 
 
 class WorkerPool:
     def __init__(
         self,
         num_workers: int,
-        num_priority_groups: int,
+        scheduler: AbstractScheduler,
         event_handler: EventHandler,
         cancel_event: asyncio.Event,
+        queue_size: int,
+        policies: Dict[str, BackpressurePolicy],
+        name: str,
+        metrics: BusMetrics,
+        coalesce: bool = False,
+        aging: float = 0.0,
+        on_done: Optional[Callable[[Event], None]] = None,
+        causes: Optional[Dict[Hashable, Causation]] = None,
     ):
         self.events_in_queue = set()
+        self.worker_tasks = set()
         self.workers = [
-            EventWorker(event_handler, cancel_event, self.events_in_queue)
-            for _ in range(num_workers)
+            EventWorker(
+                event_handler,
+                cancel_event,
+                self.events_in_queue,
+                {} if causes is None else causes,
+                self.worker_tasks,
+                queue_size,
+                policies,
+                f"{name}_{i}",
+                coalesce,
+                metrics,
+                aging,
+                on_done,
+            )
+            for i in range(num_workers)
         ]
-        self.load_balancer = LoadBalancer(num_priority_groups)
+        self.scheduler = scheduler
 
-    async def dispatch_to_worker(self, event: Event, *args, **kwargs) -> None:
-        priority_group = self.load_balancer.determine_priority_group(
-            event.meta.priority
+    async def dispatch_to_worker(self, event: Event, *args, **kwargs) -> bool:
+        priority_group = self.scheduler.determine_priority_group(event.meta.priority)
+
+        worker = self.workers[priority_group % len(self.workers)]
+
+        queued = await worker.dispatch(event, *args, **kwargs)
+
+        self.scheduler.register_event(priority_group)
+
+        return queued
+
+    async def dispatch_batch_to_worker(
+        self, events: List[Event], *args, **kwargs
+    ) -> None:
+        priority_group = self.scheduler.determine_priority_group(
+            events[0].meta.priority
         )
 
         worker = self.workers[priority_group % len(self.workers)]
 
-        await worker.dispatch(event, *args, **kwargs)
+        await worker.dispatch_batch(events, *args, **kwargs)
+
+        self.scheduler.register_event(priority_group)
 
-        self.load_balancer.register_event(priority_group)
+    def queue_stats(self) -> List[dict]:
+        return [worker.queue.snapshot() for worker in self.workers]
 
     async def wait(self) -> None:
         await asyncio.gather(*(worker.wait() for worker in self.workers))
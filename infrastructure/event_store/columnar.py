@@ -0,0 +1,263 @@
+import calendar
+import json
+import os
+import time
+from itertools import chain
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .compaction import ARCHIVE_DIR, DAY, archive_date, read_archive
+from .event_store import CODECS, PICKLE_CODEC
+from .segment_log import INDEX_SUFFIX, SegmentReader
+
+EXPORT_DIR = "columns"
+EXPORT_MANIFEST = "manifest.json"
+TIMESTAMP_COLUMN = "meta.timestamp"
+SETTLE_TIME = 60
+
+
+def _date_start(date: str) -> float:
+    return calendar.timegm(time.strptime(date, "%Y-%m-%d"))
+
+
+def flatten(record: dict, prefix: str = "") -> dict:
+    flat = {}
+
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+
+    return flat
+
+
+def to_column(values: List) -> np.ndarray:
+    present = [value for value in values if value is not None]
+
+    if present and all(isinstance(value, bool) for value in present):
+        if len(present) == len(values):
+            return np.array(values, dtype=np.bool_)
+
+        return np.array([np.nan if value is None else float(value) for value in values])
+
+    if present and all(
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        for value in present
+    ):
+        if len(present) == len(values) and all(
+            isinstance(value, int) for value in present
+        ):
+            return np.array(values, dtype=np.int64)
+
+        return np.array(
+            [np.nan if value is None else value for value in values], dtype=np.float64
+        )
+
+    return np.array(
+        [
+            ""
+            if value is None
+            else value
+            if isinstance(value, str)
+            else json.dumps(value, default=str)
+            for value in values
+        ],
+        dtype=np.str_,
+    )
+
+
+def to_columns(rows: List[dict]) -> Dict[str, np.ndarray]:
+    flat = [flatten(row) for row in rows]
+    names = list(dict.fromkeys(name for row in flat for name in row))
+
+    return {name: to_column([row.get(name) for row in flat]) for name in names}
+
+
+class ColumnarExporter:
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+
+    def export(self, group: str, archived: bool = True) -> List[str]:
+        dir_path = os.path.join(self.base_dir, group)
+        export_path = self._get_export_path(group)
+
+        if not os.path.exists(export_path):
+            os.makedirs(export_path)
+
+        manifest = self._read_manifest(export_path)
+        sources = self._list_sources(dir_path, archived)
+
+        if manifest["sources"] == sources:
+            return []
+
+        complete = set(manifest["complete"])
+        start = _date_start(max(complete)) + DAY if complete else None
+
+        records = SegmentReader(dir_path).read(start)
+
+        if archived:
+            records = chain(read_archive(dir_path, start), records)
+
+        partitions: Dict[str, List[dict]] = {}
+
+        for timestamp, codec, payload in records:
+            date = archive_date(timestamp)
+
+            if codec == PICKLE_CODEC or date in complete:
+                continue
+
+            partitions.setdefault(date, []).append(CODECS[codec](payload))
+
+        cutoff = archive_date(time.time() - SETTLE_TIME)
+        paths = []
+
+        for date, rows in sorted(partitions.items()):
+            file_path = os.path.join(export_path, f"{group}_{date}.npz")
+            tmp_path = f"{file_path}.tmp.npz"
+
+            np.savez(tmp_path, **to_columns(rows))
+            os.replace(tmp_path, file_path)
+
+            if date < cutoff:
+                complete.add(date)
+
+            paths.append(file_path)
+
+        self._write_manifest(
+            export_path, {"complete": sorted(complete), "sources": sources}
+        )
+
+        return paths
+
+    def read(
+        self,
+        group: str,
+        columns: Optional[Iterable[str]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Dict[str, np.ndarray]:
+        export_path = self._get_export_path(group)
+
+        if not os.path.exists(export_path):
+            return {}
+
+        first = archive_date(start) if start is not None else None
+        last = archive_date(end) if end is not None else None
+        parts = []
+
+        for name in sorted(os.listdir(export_path)):
+            if not name.endswith(".npz") or name.endswith(".tmp.npz"):
+                continue
+
+            date = name[: -len(".npz")].split("_")[-1]
+
+            if (first and date < first) or (last and date > last):
+                continue
+
+            with np.load(os.path.join(export_path, name)) as data:
+                mask = self._time_mask(data, start, end)
+                names = data.files if columns is None else columns
+
+                parts.append(
+                    (
+                        len(data[TIMESTAMP_COLUMN]) if mask is None else mask.sum(),
+                        {
+                            column: data[column] if mask is None else data[column][mask]
+                            for column in names
+                            if column in data.files
+                        },
+                    )
+                )
+
+        return self._concat(parts)
+
+    def _get_export_path(self, group: str) -> str:
+        return os.path.join(self.base_dir, EXPORT_DIR, group)
+
+    @staticmethod
+    def _list_sources(dir_path: str, archived: bool) -> List[List]:
+        paths = [dir_path]
+
+        if archived:
+            paths.append(os.path.join(dir_path, ARCHIVE_DIR))
+
+        sources = []
+
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+
+            for entry in os.scandir(path):
+                if entry.is_file() and not entry.name.endswith(INDEX_SUFFIX):
+                    sources.append([entry.name, entry.stat().st_size])
+
+        return sorted(sources)
+
+    @staticmethod
+    def _read_manifest(export_path: str) -> dict:
+        file_path = os.path.join(export_path, EXPORT_MANIFEST)
+
+        if not os.path.exists(file_path):
+            return {"complete": [], "sources": None}
+
+        with open(file_path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_manifest(export_path: str, manifest: dict):
+        file_path = os.path.join(export_path, EXPORT_MANIFEST)
+        tmp_path = f"{file_path}.tmp"
+
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+
+        os.replace(tmp_path, file_path)
+
+    @staticmethod
+    def _time_mask(data, start: Optional[float], end: Optional[float]):
+        if start is None and end is None:
+            return None
+
+        timestamps = data[TIMESTAMP_COLUMN]
+        mask = np.ones(len(timestamps), dtype=np.bool_)
+
+        if start is not None:
+            mask &= timestamps >= start
+
+        if end is not None:
+            mask &= timestamps <= end
+
+        return mask
+
+    @staticmethod
+    def _concat(parts: List) -> Dict[str, np.ndarray]:
+        names = list(dict.fromkeys(name for _, part in parts for name in part))
+        columns = {}
+
+        for name in names:
+            arrays = [part[name] for _, part in parts if name in part]
+
+            if any(array.dtype.kind == "U" for array in arrays):
+                dtype = np.dtype(np.str_)
+                fill = ""
+            elif len(arrays) < len(parts):
+                dtype = np.result_type(*arrays, np.float64)
+                fill = np.nan
+            else:
+                dtype = np.result_type(*arrays)
+                fill = None
+
+            columns[name] = np.concatenate(
+                [
+                    part[name].astype(dtype)
+                    if name in part
+                    else np.full(size, fill, dtype=dtype)
+                    for size, part in parts
+                ]
+            )
+
+        return columns
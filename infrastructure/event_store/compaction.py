@@ -0,0 +1,235 @@
+import asyncio
+import gzip
+import logging
+import lzma
+import os
+import time
+from typing import Dict, Iterator, List, Optional
+
+from core.interfaces.abstract_config import AbstractConfig
+from core.models.compression import Compression
+
+from .segment_log import (
+    INDEX_SUFFIX,
+    Record,
+    encode_record,
+    list_segments,
+    scan_records,
+    segment_path,
+)
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = "archive"
+ARCHIVE_MARKER = "compacted"
+DAY = 86400
+
+OPENERS = {
+    Compression.GZIP: gzip.open,
+    Compression.LZMA: lzma.open,
+}
+
+SUFFIXES = {
+    Compression.GZIP: "_snapshot.log.gz",
+    Compression.LZMA: "_snapshot.log.xz",
+}
+
+
+def archive_date(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime(timestamp))
+
+
+def read_archive(
+    dir_path: str, start: Optional[float] = None, end: Optional[float] = None
+) -> Iterator[Record]:
+    archive_path = os.path.join(dir_path, ARCHIVE_DIR)
+
+    if not os.path.exists(archive_path):
+        return
+
+    first = archive_date(start) if start is not None else None
+    last = archive_date(end) if end is not None else None
+
+    for name in sorted(os.listdir(archive_path)):
+        compression = _compression(name)
+
+        if compression is None:
+            continue
+
+        date = _archive_name_date(name)
+
+        if (first and date < first) or (last and date > last):
+            continue
+
+        with OPENERS[compression](os.path.join(archive_path, name), "rb") as f:
+            try:
+                for _, record in scan_records(f):
+                    timestamp = record[0]
+
+                    if (start is not None and timestamp < start) or (
+                        end is not None and timestamp > end
+                    ):
+                        continue
+
+                    yield record
+            except EOFError:
+                logger.warning(f"Archive {name} ends with a truncated member")
+
+
+def _archive_name_date(name: str) -> str:
+    return name.split("_")[-3]
+
+
+def _compression(name: str) -> Optional[Compression]:
+    for compression, suffix in SUFFIXES.items():
+        if name.endswith(suffix):
+            return compression
+
+    return None
+
+
+class EventCompactor:
+    def __init__(self, config_service: AbstractConfig):
+        store = config_service.get("store")
+        config = config_service.get("compaction")
+
+        self.base_dir = store["base_dir"]
+        self.interval = config["interval"]
+        self.compact_after = config["compact_after"]
+        self.compression = Compression(config["compression"])
+        self.retention = config["retention"]
+        self.retention_by_group = {
+            key[: -len("_retention")]: value
+            for key, value in config.items()
+            if key.endswith("_retention")
+        }
+        self._task = None
+
+        if self.compression not in OPENERS:
+            raise ValueError(f"Unknown Compression: {self.compression}")
+
+    def start(self):
+        if self._task is None and self.interval:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def compact(self, now: Optional[float] = None) -> Dict[str, int]:
+        now = now or time.time()
+        compacted = {}
+
+        for group in self._list_groups():
+            dir_path = os.path.join(self.base_dir, group)
+            compacted[group] = self._compact_group(dir_path, group, now)
+            self._apply_retention(dir_path, group, now)
+
+        return compacted
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+
+            try:
+                compacted = await asyncio.to_thread(self.compact)
+                logger.info(f"Compacted segments: {compacted}")
+            except Exception as e:
+                logger.error(f"Failed to compact event store: {e}")
+
+    def _compact_group(self, dir_path: str, group: str, now: float) -> int:
+        archive_path = os.path.join(dir_path, ARCHIVE_DIR)
+        marker = self._read_marker(archive_path)
+        count = 0
+
+        for base in list_segments(dir_path)[:-1]:
+            file_path = segment_path(dir_path, base)
+
+            if base > marker:
+                records = self._read_segment(file_path)
+
+                if records and records[-1][0] > now - self.compact_after:
+                    break
+
+                self._archive(archive_path, group, base, records)
+                self._write_marker(archive_path, base)
+
+            os.remove(file_path)
+
+            if os.path.exists(segment_path(dir_path, base, INDEX_SUFFIX)):
+                os.remove(segment_path(dir_path, base, INDEX_SUFFIX))
+
+            count += 1
+
+        return count
+
+    def _archive(self, archive_path: str, group: str, base: int, records: List[Record]):
+        if not os.path.exists(archive_path):
+            os.makedirs(archive_path)
+
+        by_date: Dict[str, List[Record]] = {}
+
+        for record in records:
+            by_date.setdefault(archive_date(record[0]), []).append(record)
+
+        for date, dated_records in by_date.items():
+            file_path = os.path.join(
+                archive_path,
+                f"{group}_{date}_{base:020d}{SUFFIXES[self.compression]}",
+            )
+            tmp_path = f"{file_path}.tmp"
+
+            with OPENERS[self.compression](tmp_path, "wb") as f:
+                f.write(b"".join(encode_record(*record) for record in dated_records))
+
+            os.replace(tmp_path, file_path)
+
+    def _apply_retention(self, dir_path: str, group: str, now: float):
+        retention = self.retention_by_group.get(group, self.retention)
+        archive_path = os.path.join(dir_path, ARCHIVE_DIR)
+
+        if not retention or not os.path.exists(archive_path):
+            return
+
+        cutoff = archive_date(now - retention * DAY)
+
+        for name in os.listdir(archive_path):
+            if _compression(name) is not None and _archive_name_date(name) < cutoff:
+                os.remove(os.path.join(archive_path, name))
+                logger.info(f"Removed expired archive {name}")
+
+    def _list_groups(self) -> List[str]:
+        if not os.path.exists(self.base_dir):
+            return []
+
+        return sorted(
+            name
+            for name in os.listdir(self.base_dir)
+            if list_segments(os.path.join(self.base_dir, name))
+        )
+
+    @staticmethod
+    def _read_segment(file_path: str) -> List[Record]:
+        with open(file_path, "rb") as f:
+            return [record for _, record in scan_records(f)]
+
+    @staticmethod
+    def _read_marker(archive_path: str) -> int:
+        file_path = os.path.join(archive_path, ARCHIVE_MARKER)
+
+        if not os.path.exists(file_path):
+            return -1
+
+        with open(file_path, "r") as f:
+            return int(f.read() or -1)
+
+    @staticmethod
+    def _write_marker(archive_path: str, base: int):
+        file_path = os.path.join(archive_path, ARCHIVE_MARKER)
+        tmp_path = f"{file_path}.tmp"
+
+        with open(tmp_path, "w") as f:
+            f.write(str(base))
+
+        os.replace(tmp_path, file_path)
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import os
+import pickle
+import time
+from typing import Any, Dict, FrozenSet, Hashable, Iterator, Optional, Tuple
+
+from core.events.base import Event
+from core.interfaces.abstract_config import AbstractConfig
+from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+
+from .event_store import CODECS, PICKLE_CODEC, REPLAY_GROUP, EventStore
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+class EventReplay:
+    def __init__(
+        self,
+        config_service: AbstractConfig,
+        dispatcher: EventDispatcher,
+        states: Dict[str, Any],
+    ):
+        config = config_service.get("replay")
+
+        self.dispatcher = dispatcher
+        self.store = EventStore(config_service)
+        self.states = states
+        self.snapshot_interval = config["snapshot_interval"]
+        self.snapshot_retention = config["snapshot_retention"]
+        self.snapshot_dir = os.path.join(self.store.base_dir, "snapshots")
+        self._task = None
+
+        if not os.path.exists(self.snapshot_dir):
+            os.makedirs(self.snapshot_dir)
+
+    async def restore(self) -> int:
+        start = time.perf_counter()
+        snapshot = self._load_snapshot()
+        timestamp, applied = None, frozenset()
+
+        if snapshot:
+            timestamp, applied, states = snapshot
+
+            for name, state in states.items():
+                if name in self.states:
+                    self.states[name].restore(state)
+
+        await self.store.flush()
+
+        count = await self.dispatcher.replay(self._read_events(timestamp, applied))
+
+        logger.info(
+            f"Restored state from snapshot={timestamp} and {count} events "
+            + f"in {time.perf_counter() - start:.2f}s"
+        )
+
+        return count
+
+    def snapshot(self) -> str:
+        timestamp, applied = self.dispatcher.watermark()
+        states = {name: state.snapshot() for name, state in self.states.items()}
+
+        file_path = os.path.join(
+            self.snapshot_dir, f"{time.time_ns() // 1000:020d}{SNAPSHOT_SUFFIX}"
+        )
+        tmp_path = f"{file_path}.tmp"
+
+        with open(tmp_path, "wb") as f:
+            pickle.dump((timestamp, applied, states), f, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, file_path)
+
+        for expired in self._list_snapshots()[: -self.snapshot_retention]:
+            os.remove(os.path.join(self.snapshot_dir, expired))
+
+        return file_path
+
+    def start(self):
+        if self._task is None and self.snapshot_interval:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self.snapshot()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+
+            try:
+                self.snapshot()
+            except Exception as e:
+                logger.error(f"Failed to take snapshot: {e}")
+
+    def _read_events(
+        self, start: Optional[float], applied: FrozenSet[Hashable]
+    ) -> Iterator[Event]:
+        records = self.store.records(REPLAY_GROUP, start, archived=True)
+
+        for timestamp, codec, payload in records:
+            if codec != PICKLE_CODEC or (start is not None and timestamp <= start):
+                continue
+
+            event = CODECS[codec](payload)
+
+            if event.meta.id not in applied:
+                yield event
+
+    def _load_snapshot(
+        self,
+    ) -> Optional[Tuple[Optional[float], FrozenSet[Hashable], Dict[str, Any]]]:
+        for name in reversed(self._list_snapshots()):
+            try:
+                with open(os.path.join(self.snapshot_dir, name), "rb") as f:
+                    return pickle.load(f)
+            except Exception as e:
+                logger.error(f"Skipping unreadable snapshot {name}: {e}")
+
+        return None
+
+    def _list_snapshots(self):
+        return sorted(
+            name
+            for name in os.listdir(self.snapshot_dir)
+            if name.endswith(SNAPSHOT_SUFFIX)
+        )
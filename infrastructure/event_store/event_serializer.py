@@ -0,0 +1,102 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Type
+
+import orjson
+
+from core.events.base import Event, EventMeta
+from core.events.portfolio import PortfolioPerformanceUpdated
+from core.events.position import PositionEvent
+from core.events.signal import SignalEntryEvent, SignalExitEvent
+from core.interfaces.abstract_position_risk_strategy import AbstractPositionRiskStrategy
+from core.interfaces.abstract_position_take_profit_strategy import (
+    AbstractPositionTakeProfitStrategy,
+)
+from core.models.portfolio import Performance
+from core.models.position import Position
+from core.models.signal import Signal
+
+OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+FieldEncoder = Callable[[Any], Any]
+
+
+class EventSerializer:
+    def __init__(self):
+        self._field_encoders: Dict[Type, Dict[str, FieldEncoder]] = {}
+        self._compiled: Dict[Type, Callable[[Any], dict]] = {}
+
+    def register(self, event_class: Type[Event], **encoders: FieldEncoder) -> None:
+        self._field_encoders[event_class] = encoders
+        self._compiled = {}
+
+    def to_dict(self, obj: Any) -> dict:
+        obj_class = type(obj)
+        encode = self._compiled.get(obj_class)
+
+        if encode is None:
+            encode = self._compiled[obj_class] = self._compile(obj_class)
+
+        return encode(obj)
+
+    def encode(self, event: Event) -> bytes:
+        return orjson.dumps(self.to_dict(event), default=self._default, option=OPTIONS)
+
+    def _default(self, obj: Any) -> Any:
+        if is_dataclass(obj):
+            return self.to_dict(obj)
+        if isinstance(obj, AbstractPositionRiskStrategy):
+            return obj.__class__.__name__
+        if isinstance(obj, AbstractPositionTakeProfitStrategy):
+            return obj.__class__.__name__
+        if isinstance(obj, type(Any)):
+            return "Any"
+
+        return str(obj)
+
+    def _compile(self, obj_class: Type) -> Callable[[Any], dict]:
+        encoders = {}
+
+        for cls in reversed(obj_class.__mro__):
+            encoders.update(self._field_encoders.get(cls, {}))
+
+        scope = {f"_{name}": encoder for name, encoder in encoders.items()}
+        items = []
+
+        for field in fields(obj_class):
+            name = field.name
+
+            if name == "meta" and issubclass(obj_class, Event):
+                meta = ", ".join(
+                    f"'{meta.name}': obj.meta.{meta.name}" for meta in fields(EventMeta)
+                )
+                value = f"{{{meta}, 'name': '{obj_class.__name__}'}}"
+            elif name in encoders:
+                value = f"_{name}(obj.{name})"
+            else:
+                value = f"obj.{name}"
+
+            items.append(f"'{name}': {value}")
+
+        source = f"def encode(obj):\n    return {{{', '.join(items)}}}\n"
+
+        exec(compile(source, f"<serializer {obj_class.__name__}>", "exec"), scope)
+
+        return scope["encode"]
+
+
+serializer = EventSerializer()
+
+serializer.register(PositionEvent, position=Position.to_dict)
+serializer.register(SignalEntryEvent, signal=Signal.to_dict)
+serializer.register(SignalExitEvent, signal=Signal.to_dict)
+serializer.register(
+    PortfolioPerformanceUpdated,
+    symbol=str,
+    timeframe=str,
+    strategy=str,
+    performance=Performance.to_dict,
+)
@@ -1,11 +1,36 @@
+import asyncio
+import copy
 import json
+import logging
 import os
-from typing import Optional
+import pickle
+from typing import Dict, Iterator, List, Optional
+
+import orjson
 
 from core.events.base import Event
 from core.interfaces.abstract_config import AbstractConfig
+from core.models.durability import Durability
+
+from .compaction import read_archive
+from .event_serializer import serializer
+from .segment_log import Record, SegmentLog, SegmentReader
+from .store_writer import StoreWriter
+
+logger = logging.getLogger(__name__)
 
-from .event_encoder import Encoder
+JSON_CODEC = 1
+ORJSON_CODEC = 2
+PICKLE_CODEC = 3
+
+CODECS = {
+    JSON_CODEC: json.loads,
+    ORJSON_CODEC: orjson.loads,
+    PICKLE_CODEC: pickle.loads,
+}
+
+REPLAY_GROUP = "replay"
+DLQ_GROUP = "dlq"
 
 
 class SingletonMeta(type):
@@ -20,6 +45,7 @@ class SingletonMeta(type):
 class EventStore(metaclass=SingletonMeta):
     def __init__(self, config_service: AbstractConfig):
         config = config_service.get("store")
+        replay = config_service.get("replay") or {}
 
         self.base_dir = config["base_dir"]
 
@@ -27,65 +53,171 @@ class EventStore(metaclass=SingletonMeta):
             os.makedirs(self.base_dir)
 
         self.buffer_size = config["buf_size"]
-        self.buffer = {}
-
-    def append(self, event: Event):
-        group = str(event.meta.group)
-
-        if group not in self.buffer:
-            self.buffer[group] = []
-
-        self.buffer[group].append(event)
-
-        if len(self.buffer[group]) >= self.buffer_size:
-            self._flush_buffer(group)
-
-    def get(self, group: str) -> list:
-        file_path = self._get_file_path(group)
-
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                events_from_file = json.load(f)
-        else:
-            events_from_file = []
-
-        events_from_buffer = self.buffer.get(group, [])
-
-        return events_from_file + events_from_buffer
+        self.segment_size = config["segment_size"]
+        self.index_interval = config["index_interval"]
+        self.queue_size = config.get("queue_size", 1024)
+        self.flush_interval = config.get("flush_interval", 1.0)
+        self.durability = Durability(
+            config.get("durability", Durability.BUFFERED.value)
+        )
+        self.replay_events = {name.strip() for name in replay.get("events", [])}
+        self.logs = {}
+        self.unpicklable = 0
+        self._writer = None
+
+    @property
+    def writer(self) -> StoreWriter:
+        if self._writer is None:
+            self._writer = StoreWriter(
+                self._commit, self.queue_size, self.buffer_size, self.flush_interval
+            )
+        return self._writer
+
+    async def append(self, event: Event):
+        await self.writer.submit([event])
+
+    async def append_many(self, events: List[Event]):
+        await self.writer.submit(events)
+
+    async def get(self, group: str) -> list:
+        await self.flush()
+
+        return await asyncio.to_thread(list, self.read(group))
+
+    def read(
+        self,
+        group: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        archived: bool = False,
+    ) -> Iterator[dict]:
+        for _, codec, payload in self.records(group, start, end, archived):
+            yield self._decode(codec, payload)
+
+    def records(
+        self,
+        group: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        archived: bool = False,
+    ) -> Iterator[Record]:
+        dir_path = self._get_group_path(group)
+
+        if archived:
+            yield from read_archive(dir_path, start, end)
+
+        yield from SegmentReader(dir_path).read(start, end)
+
+    async def flush(self) -> None:
+        if self._writer is not None:
+            await self._writer.flush()
 
     def close(self) -> None:
-        for group in self.buffer:
-            self._flush_buffer(group)
-
-    def _get_file_path(self, group: str, date: Optional[str] = None) -> str:
-        if date:
-            filename = f"{group}_{date}_snapshot.json"
-        else:
-            filename = f"{group}.json"
-
-        return os.path.join(self.base_dir, filename)
-
-    def _flush_buffer(self, group: str) -> None:
-        if group in self.buffer and len(self.buffer[group]) > 0:
-            self._append_to_file(group, self.buffer[group])
-            self.buffer[group] = []
-
-    def _append_to_file(self, group: str, events: list) -> None:
-        file_path = self._get_file_path(group)
-
-        if not os.path.exists(file_path):
-            with open(file_path, "w") as f:
-                f.write("[]")
-
-        with open(file_path, "rb+") as f:
-            f.seek(-1, os.SEEK_END)
-            f.truncate()
-
-            for event in events:
-                if f.tell() > 1:
-                    f.write(",".encode("utf-8"))
-
-                event_data = json.dumps(event, cls=Encoder)
-                f.write(event_data.encode("utf-8"))
-
-            f.write("]".encode("utf-8"))
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+        for log in self.logs.values():
+            log.close()
+
+        self.logs = {}
+
+    def stats(self) -> dict:
+        return self._writer.stats() if self._writer is not None else {}
+
+    def _get_group_path(self, group: str) -> str:
+        return os.path.join(self.base_dir, group)
+
+    def _get_log(self, group: str) -> SegmentLog:
+        if group not in self.logs:
+            self.logs[group] = SegmentLog(
+                self._get_group_path(group), self.segment_size, self.index_interval
+            )
+
+        return self.logs[group]
+
+    def _commit(self, groups: Dict[str, List[Event]]) -> int:
+        size = 0
+        replay = groups.pop(REPLAY_GROUP, [])
+
+        try:
+            for group in list(groups):
+                events = groups[group]
+
+                if group == DLQ_GROUP:
+                    size += self._append_to_log(
+                        group,
+                        [
+                            (event.meta.timestamp, PICKLE_CODEC, self._pickle(event))
+                            for event in events
+                        ],
+                    )
+                    del groups[group]
+                    continue
+
+                size += self._append_to_log(
+                    group,
+                    [
+                        (event.meta.timestamp, ORJSON_CODEC, serializer.encode(event))
+                        for event in events
+                    ],
+                )
+                del groups[group]
+
+                if self.replay_events:
+                    replay.extend(
+                        event
+                        for event in events
+                        if event.__class__.__name__ in self.replay_events
+                    )
+
+            if replay:
+                replay.sort(key=lambda event: event.meta.key)
+                size += self._append_to_log(
+                    REPLAY_GROUP,
+                    [
+                        (
+                            event.meta.timestamp,
+                            PICKLE_CODEC,
+                            pickle.dumps(event, pickle.HIGHEST_PROTOCOL),
+                        )
+                        for event in replay
+                    ],
+                )
+                replay = []
+        finally:
+            if replay:
+                groups[REPLAY_GROUP] = replay
+
+        return size
+
+    def _append_to_log(self, group: str, records: list) -> int:
+        log = self._get_log(group)
+        size = log.append(records)
+
+        if self.durability == Durability.FSYNC:
+            log.sync()
+
+        return size
+
+    def _pickle(self, event: Event) -> bytes:
+        try:
+            return pickle.dumps(event, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.unpicklable += 1
+            logger.warning(
+                f"Dead letter {event.event.__class__.__name__} is not picklable "
+                f"and will not be replayed: {e}"
+            )
+
+            fallback = copy.copy(event)
+            object.__setattr__(fallback, "event", repr(event.event))
+
+            return pickle.dumps(fallback, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode(codec: int, payload: bytes) -> dict:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown Codec: {codec}")
+
+        return CODECS[codec](payload)
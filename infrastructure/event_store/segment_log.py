@@ -0,0 +1,296 @@
+import os
+import struct
+import zlib
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+HEADER = struct.Struct("<IIBd")
+INDEX_ENTRY = struct.Struct("<ddQQ")
+
+SEGMENT_SUFFIX = ".log"
+INDEX_SUFFIX = ".idx"
+
+Record = Tuple[float, int, bytes]
+
+
+def list_segments(dir_path: str) -> List[int]:
+    if not os.path.exists(dir_path):
+        return []
+
+    return sorted(
+        int(name[: -len(SEGMENT_SUFFIX)])
+        for name in os.listdir(dir_path)
+        if name.endswith(SEGMENT_SUFFIX)
+    )
+
+
+def segment_path(dir_path: str, base: int, suffix: str = SEGMENT_SUFFIX) -> str:
+    return os.path.join(dir_path, f"{base:020d}{suffix}")
+
+
+def read_index(dir_path: str, base: int) -> List[Tuple[float, float, int, int]]:
+    file_path = segment_path(dir_path, base, INDEX_SUFFIX)
+
+    if not os.path.exists(file_path):
+        return []
+
+    with open(file_path, "rb") as f:
+        data = f.read()
+
+    size = len(data) - len(data) % INDEX_ENTRY.size
+
+    return list(INDEX_ENTRY.iter_unpack(data[:size]))
+
+
+def encode_record(timestamp: float, codec: int, payload: bytes) -> bytes:
+    return HEADER.pack(len(payload), zlib.crc32(payload), codec, timestamp) + payload
+
+
+def scan_records(f: BinaryIO) -> Iterator[Tuple[int, Record]]:
+    while True:
+        position = f.tell()
+        header = f.read(HEADER.size)
+
+        if len(header) < HEADER.size:
+            return
+
+        length, checksum, codec, timestamp = HEADER.unpack(header)
+        payload = f.read(length)
+
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return
+
+        yield position, (timestamp, codec, payload)
+
+
+class SegmentLog:
+    def __init__(self, dir_path: str, segment_size: int, index_interval: int):
+        self.dir_path = dir_path
+        self.segment_size = segment_size
+        self.index_interval = index_interval
+
+        if not os.path.exists(self.dir_path):
+            os.makedirs(self.dir_path)
+
+        segments = list_segments(self.dir_path)
+
+        self._base = segments[-1] if segments else 0
+        self._count = 0
+        self._position = 0
+        self._block = None
+        self._recover()
+
+        self._file = open(segment_path(self.dir_path, self._base), "ab")
+        self._index = open(segment_path(self.dir_path, self._base, INDEX_SUFFIX), "ab")
+
+    def append(self, records: Iterable[Record]) -> int:
+        data = bytearray()
+        index = bytearray()
+        size = 0
+        state = self._state()
+
+        for timestamp, codec, payload in records:
+            if self._position >= self.segment_size:
+                index += self._close_block()
+                self._write(data, index, state)
+                data, index = bytearray(), bytearray()
+                self._rotate()
+                state = self._state()
+
+            if (
+                self._block is not None
+                and self._position - self._block[2] >= self.index_interval
+            ):
+                index += self._close_block()
+
+            self._extend_block(timestamp)
+
+            data += encode_record(timestamp, codec, payload)
+
+            self._position += HEADER.size + len(payload)
+            self._count += 1
+            size += HEADER.size + len(payload)
+
+        self._write(data, index, state)
+
+        return size
+
+    def sync(self) -> None:
+        os.fsync(self._file.fileno())
+        os.fsync(self._index.fileno())
+
+    def close(self) -> None:
+        self._write(bytearray(), self._close_block())
+        self._file.close()
+        self._index.close()
+
+    def _extend_block(self, timestamp: float) -> None:
+        if self._block is None:
+            self._block = [timestamp, timestamp, self._position]
+        elif timestamp < self._block[0]:
+            self._block[0] = timestamp
+        elif timestamp > self._block[1]:
+            self._block[1] = timestamp
+
+    def _close_block(self) -> bytes:
+        if self._block is None:
+            return b""
+
+        low, high, start = self._block
+        self._block = None
+
+        return INDEX_ENTRY.pack(low, high, start, self._position)
+
+    def _state(self) -> Tuple[int, int, Optional[List]]:
+        return (
+            self._position,
+            self._count,
+            None if self._block is None else list(self._block),
+        )
+
+    def _write(
+        self,
+        data: bytearray,
+        index: bytearray,
+        state: Optional[Tuple[int, int, Optional[List]]] = None,
+    ) -> None:
+        position, indexed = self._file.tell(), self._index.tell()
+
+        try:
+            if data:
+                self._file.write(data)
+                self._file.flush()
+
+            if index:
+                self._index.write(index)
+                self._index.flush()
+        except Exception:
+            if state is not None:
+                self._rollback(position, indexed, state)
+
+            raise
+
+    def _rollback(
+        self, position: int, indexed: int, state: Tuple[int, int, Optional[List]]
+    ) -> None:
+        self._position, self._count, self._block = state
+
+        for f in (self._file, self._index):
+            try:
+                f.close()
+            except OSError:
+                pass
+
+        file_path = segment_path(self.dir_path, self._base)
+        index_path = segment_path(self.dir_path, self._base, INDEX_SUFFIX)
+
+        os.truncate(file_path, position)
+        os.truncate(index_path, indexed)
+
+        self._file = open(file_path, "ab")
+        self._index = open(index_path, "ab")
+
+    def _rotate(self) -> None:
+        self.close()
+
+        self._base += self._count
+        self._count = 0
+        self._position = 0
+
+        self._file = open(segment_path(self.dir_path, self._base), "ab")
+        self._index = open(segment_path(self.dir_path, self._base, INDEX_SUFFIX), "ab")
+
+    def _recover(self) -> None:
+        file_path = segment_path(self.dir_path, self._base)
+
+        if not os.path.exists(file_path):
+            return
+
+        timestamps = []
+
+        with open(file_path, "rb+") as f:
+            for position, (timestamp, _, payload) in scan_records(f):
+                timestamps.append((position, timestamp))
+                self._position = position + HEADER.size + len(payload)
+                self._count += 1
+
+            f.truncate(self._position)
+
+        entries = [
+            entry
+            for entry in read_index(self.dir_path, self._base)
+            if entry[3] <= self._position
+        ]
+
+        with open(segment_path(self.dir_path, self._base, INDEX_SUFFIX), "wb") as f:
+            for entry in entries:
+                f.write(INDEX_ENTRY.pack(*entry))
+
+        indexed = entries[-1][3] if entries else 0
+
+        for position, timestamp in timestamps:
+            if position >= indexed:
+                if self._block is None:
+                    self._block = [timestamp, timestamp, position]
+                else:
+                    self._block[0] = min(self._block[0], timestamp)
+                    self._block[1] = max(self._block[1], timestamp)
+
+
+class SegmentReader:
+    def __init__(self, dir_path: str):
+        self.dir_path = dir_path
+
+    def read(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Iterator[Record]:
+        for base in list_segments(self.dir_path):
+            try:
+                f = open(segment_path(self.dir_path, base), "rb")
+            except FileNotFoundError:
+                continue
+
+            with f:
+                for position, stop in self._ranges(base, start, end):
+                    f.seek(position)
+
+                    for offset, record in scan_records(f):
+                        if stop is not None and offset >= stop:
+                            break
+
+                        timestamp = record[0]
+
+                        if (start is not None and timestamp < start) or (
+                            end is not None and timestamp > end
+                        ):
+                            continue
+
+                        yield record
+
+    def _ranges(
+        self, base: int, start: Optional[float], end: Optional[float]
+    ) -> Iterator[Tuple[int, Optional[int]]]:
+        if start is None and end is None:
+            yield 0, None
+            return
+
+        ranges = []
+        indexed = 0
+
+        for low, high, position, stop in read_index(self.dir_path, base):
+            indexed = stop
+
+            if (start is not None and high < start) or (end is not None and low > end):
+                continue
+
+            if ranges and ranges[-1][1] == position:
+                ranges[-1][1] = stop
+            else:
+                ranges.append([position, stop])
+
+        if ranges and ranges[-1][1] == indexed:
+            ranges[-1][1] = None
+        else:
+            ranges.append([indexed, None])
+
+        for position, stop in ranges:
+            yield position, stop
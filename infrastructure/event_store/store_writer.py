@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from core.events.base import Event
+from infrastructure.telemetry.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+Commit = Callable[[Dict[str, List[Event]]], int]
+
+COMMIT_RETRIES = 3
+RETRY_DELAY = 0.1
+
+
+class FlushMarker(threading.Event):
+    def __init__(self):
+        super().__init__()
+        self.error: Optional[Exception] = None
+
+
+class StoreWriter:
+    _stop = object()
+
+    def __init__(
+        self, commit: Commit, queue_size: int, batch_size: int, flush_interval: float
+    ):
+        self.commit = commit
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.write_latency = LatencyHistogram()
+        self.pending = 0
+        self.max_pending = 0
+        self.blocked = 0
+        self.batches = 0
+        self.events = 0
+        self.bytes = 0
+        self.errors = 0
+
+        self._groups: Dict[str, List[Event]] = {}
+        self._handoff = asyncio.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="event-store-writer", daemon=True
+        )
+        self._thread.start()
+
+    async def submit(self, events: List[Event]) -> None:
+        await self._put(events)
+
+    async def flush(self) -> None:
+        marker = FlushMarker()
+
+        await self._put(marker)
+        await asyncio.to_thread(marker.wait)
+
+        if marker.error is not None:
+            raise marker.error
+
+    def close(self) -> None:
+        self.queue.put(self._stop)
+        self._thread.join()
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "blocked": self.blocked,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "batches": self.batches,
+            "events": self.events,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "write_latency": self.write_latency.snapshot(),
+        }
+
+    async def _put(self, item) -> None:
+        if not self._handoff.locked():
+            try:
+                self.queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+
+        self.blocked += 1
+
+        async with self._handoff:
+            await asyncio.get_running_loop().run_in_executor(None, self.queue.put, item)
+
+    def _run(self) -> None:
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is self._stop:
+                self._commit()
+                return
+
+            if isinstance(item, FlushMarker):
+                item.error = self._commit()
+                item.set()
+                deadline = self._next_deadline()
+                continue
+
+            if item:
+                self._stage(item)
+
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if self.pending >= self.batch_size or (
+                deadline is not None and time.monotonic() >= deadline
+            ):
+                self._commit()
+                deadline = self._next_deadline()
+
+    def _stage(self, events: List[Event]) -> None:
+        for event in events:
+            self._groups.setdefault(str(event.meta.group), []).append(event)
+
+        self.pending += len(events)
+
+        if self.pending > self.max_pending:
+            self.max_pending = self.pending
+
+    def _commit(self) -> Optional[Exception]:
+        if not self.pending:
+            return None
+
+        groups, pending = self._groups, self.pending
+        self._groups = {}
+        self.pending = 0
+
+        start = time.perf_counter()
+        size = 0
+
+        for attempt in range(COMMIT_RETRIES):
+            try:
+                size += self.commit(groups)
+                break
+            except Exception as e:
+                self.errors += 1
+                error = e
+                logger.error(
+                    f"Failed to commit {pending} events "
+                    f"(attempt {attempt + 1}/{COMMIT_RETRIES}): {e}"
+                )
+
+                if attempt + 1 < COMMIT_RETRIES:
+                    time.sleep(RETRY_DELAY * 2**attempt)
+        else:
+            self._groups = groups
+            self.pending = sum(len(events) for events in groups.values())
+
+            return error
+
+        self.write_latency.record(time.perf_counter() - start)
+        self.batches += 1
+        self.events += pending
+        self.bytes += size
+
+        return None
+
+    def _next_deadline(self) -> Optional[float]:
+        return time.monotonic() + self.flush_interval if self.pending else None
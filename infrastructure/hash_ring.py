@@ -0,0 +1,27 @@
+import zlib
+from bisect import bisect
+from typing import Generic, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class HashRing(Generic[T]):
+    def __init__(self, nodes: Iterable[T], virtual_nodes: int = 64):
+        self._ring: List[Tuple[int, T]] = sorted(
+            (self._hash(f"{node}#{replica}"), node)
+            for node in nodes
+            for replica in range(virtual_nodes)
+        )
+        self._keys = [key for key, _ in self._ring]
+
+    def get(self, key: str) -> T:
+        if not self._ring:
+            raise ValueError("Empty hash ring")
+
+        idx = bisect(self._keys, self._hash(key)) % len(self._ring)
+
+        return self._ring[idx][1]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return zlib.crc32(key.encode())
@@ -0,0 +1,182 @@
+import os
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core.interfaces.abstract_config import AbstractConfig
+from core.models.exchange import ExchangeType
+from core.models.symbol import Symbol
+from core.models.timeframe import Timeframe
+
+COLUMNS = {
+    "timestamp": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+}
+
+StoreKey = Tuple[ExchangeType, Symbol, Timeframe]
+
+
+class SingletonMeta(type):
+    _instance = None
+
+    def __call__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__call__(*args, **kwargs)
+        return cls._instance
+
+
+class OHLCVStore(metaclass=SingletonMeta):
+    def __init__(self, config_service: AbstractConfig):
+        config = config_service.get("ohlcv")
+
+        self.base_dir = config["base_dir"]
+
+        if not os.path.exists(self.base_dir):
+            os.makedirs(self.base_dir)
+
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def lock(self, key: StoreKey) -> threading.Lock:
+        with self._guard:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+
+            return self._locks[key]
+
+    def coverage(self, key: StoreKey) -> Optional[Tuple[int, int]]:
+        file_path = self._get_range_path(key)
+
+        if not os.path.exists(file_path):
+            return None
+
+        start, end = np.fromfile(file_path, dtype=np.int64)
+
+        return int(start), int(end)
+
+    def missing(self, key: StoreKey, start: int, end: int) -> List[Tuple[int, int]]:
+        if start >= end:
+            return []
+
+        coverage = self.coverage(key)
+
+        if coverage is None:
+            return [(start, end)]
+
+        covered_start, covered_end = coverage
+        ranges = []
+
+        if start < covered_start:
+            ranges.append((start, covered_start))
+
+        if end > covered_end:
+            ranges.append((covered_end, end))
+
+        return ranges
+
+    def read(self, key: StoreKey, start: int, end: int) -> Tuple[np.ndarray, ...]:
+        columns = self._map_columns(key)
+
+        if columns is None:
+            return tuple(np.empty(0, dtype=dtype) for dtype in COLUMNS.values())
+
+        timestamps = columns[0]
+
+        lo = np.searchsorted(timestamps, start, side="left")
+        hi = np.searchsorted(timestamps, end, side="left")
+
+        return tuple(column[lo:hi] for column in columns)
+
+    def write(self, key: StoreKey, rows: Iterable, start: int, end: int) -> None:
+        data = np.asarray(list(rows), dtype=np.float64).reshape(-1, len(COLUMNS))
+        coverage = self.coverage(key)
+
+        if coverage is None:
+            self._write_columns(key, data, "wb")
+            self._write_range(key, start, end)
+            return
+
+        covered_start, covered_end = coverage
+        columns = self._map_columns(key)
+        last_timestamp = columns[0][-1] if columns is not None else None
+
+        if start >= covered_start and (
+            last_timestamp is None or np.all(data[:, 0] > last_timestamp)
+        ):
+            self._write_columns(key, data, "ab")
+        else:
+            self._merge_columns(key, columns, data)
+
+        self._write_range(key, min(start, covered_start), max(end, covered_end))
+
+    def _merge_columns(
+        self, key: StoreKey, columns: Optional[Tuple[np.ndarray, ...]], data: np.ndarray
+    ) -> None:
+        if columns is not None:
+            stored = np.column_stack([column.astype(np.float64) for column in columns])
+            data = np.concatenate([data, stored])
+
+        _, idx = np.unique(data[:, 0], return_index=True)
+
+        self._write_columns(key, data[idx], "wb", atomic=True)
+
+    def _write_columns(
+        self, key: StoreKey, data: np.ndarray, mode: str, atomic: bool = False
+    ) -> None:
+        dir_path = self._get_dir_path(key)
+
+        if not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        for idx, (name, dtype) in enumerate(COLUMNS.items()):
+            file_path = self._get_column_path(key, name)
+            target_path = f"{file_path}.tmp" if atomic else file_path
+
+            with open(target_path, mode) as f:
+                f.write(data[:, idx].astype(dtype).tobytes())
+
+            if atomic:
+                os.replace(target_path, file_path)
+
+    def _write_range(self, key: StoreKey, start: int, end: int) -> None:
+        file_path = self._get_range_path(key)
+        tmp_path = f"{file_path}.tmp"
+
+        np.array([start, end], dtype=np.int64).tofile(tmp_path)
+        os.replace(tmp_path, file_path)
+
+    def _map_columns(self, key: StoreKey) -> Optional[Tuple[np.ndarray, ...]]:
+        file_paths = [self._get_column_path(key, name) for name in COLUMNS]
+
+        if not all(os.path.exists(file_path) for file_path in file_paths):
+            return None
+
+        size = min(
+            os.path.getsize(file_path) // np.dtype(dtype).itemsize
+            for file_path, dtype in zip(file_paths, COLUMNS.values(), strict=True)
+        )
+
+        if size == 0:
+            return None
+
+        return tuple(
+            np.memmap(file_path, dtype=dtype, mode="r", shape=(size,))
+            for file_path, dtype in zip(file_paths, COLUMNS.values(), strict=True)
+        )
+
+    def _get_dir_path(self, key: StoreKey) -> str:
+        exchange, symbol, timeframe = key
+        return os.path.join(
+            self.base_dir, exchange.name.lower(), symbol.name, timeframe.value
+        )
+
+    def _get_column_path(self, key: StoreKey, name: str) -> str:
+        return os.path.join(self._get_dir_path(key), f"{name}.bin")
+
+    def _get_range_path(self, key: StoreKey) -> str:
+        return os.path.join(self._get_dir_path(key), "range.bin")
@@ -0,0 +1,51 @@
+from collections import defaultdict
+
+from .latency_histogram import LatencyHistogram
+from .throughput_monitor import ThroughputMonitor
+
+
+class BusMetrics:
+    def __init__(self):
+        self.queue_wait = defaultdict(LatencyHistogram)
+        self.event_execution = defaultdict(LatencyHistogram)
+        self.handler_execution = defaultdict(LatencyHistogram)
+        self.event_errors = defaultdict(int)
+        self.handler_errors = defaultdict(int)
+        self.dead_letters = defaultdict(int)
+        self.throughput = ThroughputMonitor()
+
+    def record_wait(self, event_type: str, seconds: float, count: int = 1):
+        self.queue_wait[event_type].record(seconds, count)
+        self.throughput.event_processed(count)
+
+    def record_execution(self, handler: str, event_type: str, seconds: float):
+        self.handler_execution[handler].record(seconds)
+        self.event_execution[event_type].record(seconds)
+
+    def record_failure(self, handler: str, event_type: str, dead_letters: int = 1):
+        self.handler_errors[handler] += 1
+        self.event_errors[event_type] += 1
+        self.dead_letters[event_type] += dead_letters
+
+    def snapshot(self) -> dict:
+        event_types = set(self.queue_wait) | set(self.event_execution)
+
+        return {
+            "throughput": self.throughput.throughput,
+            "events": {
+                name: {
+                    "queue_wait": self.queue_wait[name].snapshot(),
+                    "execution": self.event_execution[name].snapshot(),
+                    "errors": self.event_errors.get(name, 0),
+                    "dead_letters": self.dead_letters.get(name, 0),
+                }
+                for name in sorted(event_types)
+            },
+            "handlers": {
+                name: {
+                    "execution": histogram.snapshot(),
+                    "errors": self.handler_errors.get(name, 0),
+                }
+                for name, histogram in sorted(self.handler_execution.items())
+            },
+        }
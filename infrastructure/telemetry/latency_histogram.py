@@ -0,0 +1,52 @@
+import math
+
+NUM_BUCKETS = 32
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.buckets = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float, count: int = 1):
+        micros = int(seconds * 1e6)
+        idx = min(max(micros.bit_length() - 1, 0), NUM_BUCKETS - 1)
+
+        self.buckets[idx] += count
+        self.count += count
+        self.total += seconds * count
+
+        if seconds < self.min:
+            self.min = seconds
+
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+
+        for idx, bucket in enumerate(self.buckets):
+            seen += bucket
+
+            if seen >= rank:
+                return min((1 << (idx + 1)) / 1e6, self.max)
+
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+        }
@@ -0,0 +1,61 @@
+import asyncio
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from core.interfaces.abstract_config import AbstractConfig
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsServer:
+    def __init__(self, config_service: AbstractConfig, snapshot: Callable[[], dict]):
+        config = config_service.get("telemetry")
+
+        self.host = config["host"]
+        self.port = config["port"]
+        self.snapshot = snapshot
+        self._server = None
+
+    def start(self):
+        if not self.port or self._server:
+            return
+
+        loop = asyncio.get_running_loop()
+        snapshot = self.snapshot
+
+        async def collect():
+            return snapshot()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+
+                future = asyncio.run_coroutine_threadsafe(collect(), loop)
+                body = json.dumps(future.result(timeout=5), default=str).encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+        logger.info(f"Metrics available at http://{self.host}:{self.port}/metrics")
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,65 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class QueueMonitor:
+    def __init__(self, name: str, maxsize: int, smoothing: float = 0.1):
+        self.name = name
+        self.maxsize = maxsize
+        self.smoothing = smoothing
+        self.depth = 0
+        self.high_watermark = 0
+        self.enqueued = 0
+        self.dequeued = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.promoted = 0
+        self.lag = 0.0
+        self.avg_lag = 0.0
+        self.max_lag = 0.0
+
+    def event_enqueued(self, depth: int):
+        self.enqueued += 1
+        self.depth = depth
+
+        if depth > self.high_watermark:
+            self.high_watermark = depth
+
+            if depth == self.maxsize:
+                logger.warning(f"Queue {self.name} reached its bound of {depth}")
+
+    def event_dequeued(self, depth: int, lag: float):
+        self.dequeued += 1
+        self.depth = depth
+        self.lag = lag
+        self.avg_lag += self.smoothing * (lag - self.avg_lag)
+
+        if lag > self.max_lag:
+            self.max_lag = lag
+
+    def event_dropped(self, depth: int):
+        self.dropped += 1
+        self.depth = depth
+
+    def event_coalesced(self):
+        self.coalesced += 1
+
+    def event_promoted(self):
+        self.promoted += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "name": self.name,
+            "maxsize": self.maxsize,
+            "depth": self.depth,
+            "high_watermark": self.high_watermark,
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "promoted": self.promoted,
+            "lag": self.lag,
+            "avg_lag": self.avg_lag,
+            "max_lag": self.max_lag,
+        }
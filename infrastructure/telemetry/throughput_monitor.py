@@ -9,15 +9,17 @@ class ThroughputMonitor:
         self.events_to_log = events_to_log
         self.start_time = time.monotonic()
         self.num_events = 0
+        self.throughput = 0.0
 
-    def event_processed(self):
-        self.num_events += 1
-        if self.num_events % self.events_to_log == 0:
+    def event_processed(self, count: int = 1):
+        self.num_events += count
+        if self.num_events >= self.events_to_log:
             self._log_throughput()
 
     def _log_throughput(self):
         elapsed_time = time.monotonic() - self.start_time
         throughput = self.num_events / elapsed_time
+        self.throughput = throughput
 
         logger.debug(f"Throughput = {throughput:.2f} events/sec")
 
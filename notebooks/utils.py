@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -224,10 +225,26 @@ def plot_candlestick(data: pd.DataFrame, charts_per_row: int = 2) -> go.Figure:
     return fig
 
 
+def equity_curve_from_trades(df: pd.DataFrame, account_size: float):
+    resets = np.flatnonzero(np.diff(df["performance.total_trades"].to_numpy()) < 0)
+    run = df.iloc[resets[-1] + 1 :] if len(resets) else df
+
+    trades = run.drop_duplicates("performance.total_trades").sort_values(
+        "performance.total_trades"
+    )
+    equity = account_size + trades["performance.pnl"].to_numpy().cumsum()
+
+    if len(equity) < 2:
+        return equity, np.zeros(len(equity))
+
+    peak = np.maximum.accumulate(equity)
+
+    return equity, (peak - equity) / peak
+
+
 def plot_equity_curve(df, symbol, timeframe, strategy):
-    equity_curve = df["performance.equity"].iloc[-1]
     account_size = df["performance.account_size"].iloc[-1]
-    drawdowns = df["performance.drawdown"].iloc[-1]
+    equity_curve, drawdowns = equity_curve_from_trades(df, account_size)
     sterling_ratio = df["performance.sterling_ratio"].iloc[-1]
     hit_ratio = df["performance.hit_ratio"].iloc[-1]
     total_pnl = df["performance.total_pnl"].iloc[-1]
@@ -238,7 +255,7 @@ def plot_equity_curve(df, symbol, timeframe, strategy):
     max_consecutive_wins = df["performance.max_consecutive_wins"].iloc[-1]
     max_consecutive_losses = df["performance.max_consecutive_losses"].iloc[-1]
 
-    trades = list(range(1, total_trades + 1))
+    trades = list(range(total_trades - len(equity_curve) + 1, total_trades + 1))
 
     color_above_account = "teal"
     color_below_account = "coral"
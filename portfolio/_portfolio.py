@@ -1,5 +1,6 @@
 import asyncio
-from typing import Dict, Tuple
+from datetime import datetime
+from typing import Dict, Optional, Tuple
 
 from core.models.portfolio import Performance
 from core.models.position import Position
@@ -13,7 +14,13 @@ class PortfolioStorage:
         self.data: Dict[Tuple[Symbol, Timeframe, Strategy], Performance] = {}
         self._lock = asyncio.Lock()
 
-    async def next(self, position: Position, account_size: int, risk_per_trade: float):
+    async def next(
+        self,
+        position: Position,
+        account_size: int,
+        risk_per_trade: float,
+        updated_at: Optional[float] = None,
+    ):
         async with self._lock:
             key = self._get_key(
                 position.signal.symbol,
@@ -27,7 +34,7 @@ class PortfolioStorage:
                 performance = Performance(account_size, risk_per_trade)
 
             if position.pnl != 0:
-                performance = performance.next(position.pnl, position.fee)
+                performance = performance.next(position.pnl, position.fee, updated_at)
 
             self.data[key] = performance
 
@@ -39,11 +46,21 @@ class PortfolioStorage:
             return self.data.get(key, None)
 
     async def reset(
-        self, symbol, timeframe, strategy, account_size: int, risk_per_trade: float
+        self,
+        symbol,
+        timeframe,
+        strategy,
+        account_size: int,
+        risk_per_trade: float,
+        updated_at: Optional[float] = None,
     ):
         async with self._lock:
             key = self._get_key(symbol, timeframe, strategy)
-            self.data[key] = Performance(account_size, risk_per_trade)
+            self.data[key] = Performance(
+                account_size,
+                risk_per_trade,
+                updated_at=updated_at or datetime.now().timestamp(),
+            )
 
     async def reset_all(self):
         async with self._lock:
@@ -89,5 +106,11 @@ class PortfolioStorage:
 
             return performance.deflated_sharpe_ratio
 
+    def snapshot(self) -> dict:
+        return dict(self.data)
+
+    def restore(self, data: dict):
+        self.data = dict(data)
+
     def _get_key(self, symbol, timeframe, strategy):
         return (symbol, timeframe, strategy)
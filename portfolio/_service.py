@@ -41,6 +41,7 @@ class Portfolio(AbstractEventManager):
             event.strategy,
             self.account_size,
             self.config["risk_per_trade"],
+            event.meta.timestamp,
         )
 
     @event_handler(TradeStarted)
@@ -53,6 +54,7 @@ class Portfolio(AbstractEventManager):
                     event.strategy,
                     self.account_size,
                     self.config["risk_per_trade"],
+                    event.meta.timestamp,
                 ),
                 self.strategy.reset(event.symbol, event.timeframe, event.strategy),
             ]
@@ -70,7 +72,10 @@ class Portfolio(AbstractEventManager):
 
         if not performance or performance.updated_at < event.meta.timestamp:
             performance = await self.state.next(
-                event.position, self.account_size, self.config["risk_per_trade"]
+                event.position,
+                self.account_size,
+                self.config["risk_per_trade"],
+                event.meta.timestamp,
             )
 
         logger.info(
@@ -159,6 +164,18 @@ class Portfolio(AbstractEventManager):
             query.symbol, query.timeframe, query.strategy
         )
 
+    def snapshot(self) -> dict:
+        return {
+            "account_size": self.account_size,
+            "state": self.state.snapshot(),
+            "strategy": self.strategy.snapshot(),
+        }
+
+    def restore(self, snapshot: dict):
+        self.account_size = snapshot["account_size"]
+        self.state.restore(snapshot["state"])
+        self.strategy.restore(snapshot["strategy"])
+
     @command_handler(UpdateAccountSize)
     async def update_account_size(self, command: UpdateAccountSize):
         self.account_size = command.amount
@@ -48,6 +48,12 @@ class StrategyStorage:
             )
             return sorted_strategies[:num]
 
+    def snapshot(self) -> dict:
+        return dict(self.data)
+
+    def restore(self, data: dict):
+        self.data = dict(data)
+
     def _update_clusters(self):
         data_matrix = np.array([item[0] for item in self.data.values()])
         imputed_data = self.imputer.fit_transform(data_matrix)
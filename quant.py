@@ -13,8 +13,11 @@ from executor import OrderExecutorActorFactory
 from feed import FeedActorFactory
 from infrastructure.config import ConfigService
 from infrastructure.event_dispatcher.event_dispatcher import EventDispatcher
+from infrastructure.event_store.compaction import EventCompactor
+from infrastructure.event_store.event_replay import EventReplay
 from infrastructure.logger import configure_logging
 from infrastructure.shutdown import GracefulShutdown
+from infrastructure.telemetry.metrics_server import MetricsServer
 from optimization import StrategyOptimizerFactory
 from portfolio import Portfolio
 from position import PositionActorFactory, PositionFactory
@@ -61,10 +64,15 @@ async def main():
 
     event_bus = EventDispatcher(config_service)
 
-    exchange_factory = ExchangeFactory(EnvironmentSecretService())
-    ws_factory = WSFactory(EnvironmentSecretService())
+    exchange_factory = ExchangeFactory(EnvironmentSecretService(), config_service)
+    ws_factory = WSFactory(EnvironmentSecretService(), config_service)
 
-    Portfolio(config_service)
+    metrics_server = MetricsServer(
+        config_service, lambda: {**event_bus.snapshot(), "ws": ws_factory.stats()}
+    )
+    metrics_server.start()
+
+    portfolio = Portfolio(config_service)
     SmartRouter(exchange_factory, config_service)
 
     position_factory = PositionFactory(
@@ -106,6 +114,13 @@ async def main():
         exchange_type=ExchangeType.BYBIT,
     )
 
+    event_replay = EventReplay(config_service, event_bus, {"portfolio": portfolio})
+    await event_replay.restore()
+    event_replay.start()
+
+    event_compactor = EventCompactor(config_service)
+    event_compactor.start()
+
     trend_system_a_task = asyncio.create_task(trend_system_a.start())
     trading_system_task = asyncio.create_task(trading_system.start())
     shutdown_task = asyncio.create_task(graceful_shutdown.wait_for_exit_signal())
@@ -121,6 +136,9 @@ async def main():
         trading_system_task.cancel()
 
         trading_system.stop()
+        metrics_server.stop()
+        event_replay.stop()
+        event_compactor.stop()
 
         await event_bus.stop()
         await event_bus.wait()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 
@@ -12,6 +13,7 @@ from core.interfaces.abstract_config import AbstractConfig
 from core.interfaces.abstract_event_manager import AbstractEventManager
 from core.interfaces.abstract_exhange_factory import AbstractExchangeFactory
 from core.models.exchange import ExchangeType
+from core.models.execution import ExecutionPolicy
 from core.models.order import Order, OrderStatus
 from core.models.side import PositionSide
 from core.queries.account import GetBalance
@@ -22,6 +24,8 @@ from ._twap import TWAP
 
 logger = logging.getLogger(__name__)
 
+SYMBOLS_TTL = 120
+
 
 class SmartRouter(AbstractEventManager):
     def __init__(
@@ -32,8 +36,10 @@ class SmartRouter(AbstractEventManager):
         self.exchange = self.exchange_factory.create(ExchangeType.BYBIT)
         self.algo_price = TWAP(config_service)
         self.config = config_service.get("position")
+        self._symbols = {}
+        self._symbols_expiry = 0.0
 
-    @query_handler(GetOpenPosition)
+    @query_handler(GetOpenPosition, ExecutionPolicy.THREAD, "broker")
     def get_open_position(self, query: GetOpenPosition):
         position = query.position
 
@@ -52,7 +58,7 @@ class SmartRouter(AbstractEventManager):
                 price=broker_position["entry_price"],
             )
 
-    @query_handler(GetClosePosition)
+    @query_handler(GetClosePosition, ExecutionPolicy.THREAD, "broker")
     def get_close_position(self, query: GetClosePosition):
         position = query.position
         symbol = position.signal.symbol
@@ -71,28 +77,26 @@ class SmartRouter(AbstractEventManager):
             fee=trade["fee"],
         )
 
-    @query_handler(GetSymbols)
-    def get_symbols(self, _query: GetSymbols):
-        return self.exchange.fetch_future_symbols()
-
-    @query_handler(GetSymbol)
-    def get_symbol(self, query: GetSymbol):
-        symbols = self.exchange.fetch_future_symbols()
+    @query_handler(GetSymbols, ExecutionPolicy.INLINE)
+    async def get_symbols(self, _query: GetSymbols):
+        return list((await self._fetch_symbols()).values())
 
-        return next((symbol for symbol in symbols if symbol.name == query.symbol), None)
+    @query_handler(GetSymbol, ExecutionPolicy.INLINE)
+    async def get_symbol(self, query: GetSymbol):
+        return (await self._fetch_symbols()).get(query.symbol)
 
-    @query_handler(GetBalance)
+    @query_handler(GetBalance, ExecutionPolicy.THREAD, "broker")
     def get_account_balance(self, query: GetBalance):
         return self.exchange.fetch_account_balance(query.currency)
 
-    @command_handler(UpdateSettings)
+    @command_handler(UpdateSettings, ExecutionPolicy.THREAD, "broker")
     def update_symbol_settings(self, command: UpdateSettings):
         self.exchange.update_symbol_settings(
             command.symbol, command.position_mode, command.margin_mode, command.leverage
         )
 
-    @command_handler(OpenPosition)
-    async def open_position(self, command: OpenPosition):
+    @command_handler(OpenPosition, ExecutionPolicy.THREAD, "algo")
+    def open_position(self, command: OpenPosition):
         position = command.position
 
         logger.info(f"Try to open position: {position}")
@@ -182,8 +186,8 @@ class SmartRouter(AbstractEventManager):
         for order_id in list(order_timestamps.keys()):
             self.exchange.cancel_order(order_id, symbol)
 
-    @command_handler(AdjustPosition)
-    async def adjust_position(self, command: AdjustPosition):
+    @command_handler(AdjustPosition, ExecutionPolicy.THREAD, "algo")
+    def adjust_position(self, command: AdjustPosition):
         position = command.position
 
         logger.info(f"Try to adjust position: {position}")
@@ -269,8 +273,8 @@ class SmartRouter(AbstractEventManager):
         for order_id in list(order_timestamps.keys()):
             self.exchange.cancel_order(order_id, symbol)
 
-    @command_handler(ClosePosition)
-    async def close_position(self, command: ClosePosition):
+    @command_handler(ClosePosition, ExecutionPolicy.THREAD, "algo")
+    def close_position(self, command: ClosePosition):
         position = command.position
         symbol = position.signal.symbol
 
@@ -345,3 +349,16 @@ class SmartRouter(AbstractEventManager):
 
         if self.exchange.fetch_position(symbol, position_side):
             self.exchange.close_full_position(symbol, position_side)
+
+    async def _fetch_symbols(self):
+        if time.monotonic() >= self._symbols_expiry:
+            symbols = await asyncio.to_thread(self.exchange.fetch_future_symbols)
+
+            self._symbols = {}
+
+            for symbol in symbols:
+                self._symbols.setdefault(symbol.name, symbol)
+
+            self._symbols_expiry = time.monotonic() + SYMBOLS_TTL
+
+        return self._symbols